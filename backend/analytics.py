@@ -0,0 +1,145 @@
+"""
+Signup analytics served from precomputed rollup tables
+"""
+from datetime import datetime, timedelta
+
+# Largest number of buckets one series request may return
+MAX_BUCKETS = 2000
+GRANULARITIES = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+# Growth windows reported by fetch_analytics, in hours
+GROWTH_WINDOWS = {"24h": 24, "7d": 24 * 7}
+
+_TIMESTAMP = "%Y-%m-%d %H:%M:%S"
+
+
+def floor_time(value: datetime, granularity: str) -> datetime:
+    value = value.replace(minute=0, second=0, microsecond=0)
+    return value.replace(hour=0) if granularity == "day" else value
+
+
+def rebuild_rollups(cursor):
+    """Recompute every rollup table from the waitlist table"""
+    cursor.execute("DELETE FROM signups_hourly")
+    cursor.execute("""
+        INSERT INTO signups_hourly (hour, signups)
+        SELECT strftime('%Y-%m-%d %H:00:00', created_at), COUNT(*)
+        FROM waitlist GROUP BY 1
+    """)
+    cursor.execute("DELETE FROM signups_by_domain")
+    cursor.execute("""
+        INSERT INTO signups_by_domain (domain, signups)
+        SELECT website_domain, COUNT(*) FROM waitlist
+        WHERE website_domain IS NOT NULL GROUP BY 1
+    """)
+
+
+def last_signup_id(cursor) -> int:
+    """Highest waitlist id, taken before inserting rows for ``add_to_rollups``"""
+    return cursor.execute("SELECT COALESCE(MAX(id), 0) FROM waitlist").fetchone()[0]
+
+
+def add_to_rollups(cursor, after_id: int):
+    """Fold rows inserted after ``after_id`` into the rollups.
+
+    Call this in the inserting transaction, once per batch. It runs two
+    grouped upserts over the new rows, where a per-row trigger would run two
+    upserts for every row.
+    """
+    cursor.execute("""
+        INSERT INTO signups_hourly (hour, signups)
+        SELECT strftime('%Y-%m-%d %H:00:00', created_at), COUNT(*)
+        FROM waitlist WHERE id > ? GROUP BY 1
+        ON CONFLICT(hour) DO UPDATE SET signups = signups + excluded.signups
+    """, (after_id,))
+    cursor.execute("""
+        INSERT INTO signups_by_domain (domain, signups)
+        SELECT website_domain, COUNT(*)
+        -- NOT INDEXED: read only the new rows by rowid, instead of letting the planner
+        -- walk the whole website_domain index for "IS NOT NULL"
+        FROM waitlist NOT INDEXED WHERE id > ? AND website_domain IS NOT NULL GROUP BY 1
+        ON CONFLICT(domain) DO UPDATE SET signups = signups + excluded.signups
+    """, (after_id,))
+
+
+def rollup_totals(cursor) -> tuple:
+    """``(signups, signups with a domain)`` according to the rollup tables"""
+    hourly = cursor.execute("SELECT COALESCE(SUM(signups), 0) FROM signups_hourly").fetchone()[0]
+    domains = cursor.execute("SELECT COALESCE(SUM(signups), 0) FROM signups_by_domain").fetchone()[0]
+    return hourly, domains
+
+
+def fetch_series(conn, granularity: str, since: datetime, until: datetime) -> list:
+    """Zero-filled ``[{"start", "signups"}]`` buckets covering [since, until)"""
+    start = floor_time(since, granularity)
+    if granularity == "day":
+        rows = conn.execute(
+            "SELECT substr(hour, 1, 10) || ' 00:00:00', SUM(signups) FROM signups_hourly "
+            "WHERE hour >= ? AND hour < ? GROUP BY 1",
+            (start.strftime(_TIMESTAMP), until.strftime(_TIMESTAMP))
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT hour, signups FROM signups_hourly WHERE hour >= ? AND hour < ?",
+            (start.strftime(_TIMESTAMP), until.strftime(_TIMESTAMP))
+        ).fetchall()
+    counts = dict(rows)
+
+    step = GRANULARITIES[granularity]
+    buckets = []
+    current = start
+    while current < until:
+        key = current.strftime(_TIMESTAMP)
+        buckets.append({"start": key, "signups": counts.get(key, 0)})
+        current += step
+    return buckets
+
+
+def fetch_top_domains(conn, limit: int) -> list:
+    rows = conn.execute(
+        "SELECT domain, signups FROM signups_by_domain ORDER BY signups DESC, domain LIMIT ?",
+        (limit,)
+    ).fetchall()
+    return [{"domain": domain, "signups": signups} for domain, signups in rows]
+
+
+def fetch_growth(conn, now: datetime) -> dict:
+    """Signups in each trailing window against the window before it"""
+    current_hour = floor_time(now, "hour")
+    growth = {}
+    for name, hours in GROWTH_WINDOWS.items():
+        window_start = current_hour - timedelta(hours=hours - 1)
+        previous_start = window_start - timedelta(hours=hours)
+        current, previous = conn.execute(
+            "SELECT "
+            "COALESCE(SUM(CASE WHEN hour >= ? THEN signups END), 0), "
+            "COALESCE(SUM(CASE WHEN hour < ? THEN signups END), 0) "
+            "FROM signups_hourly WHERE hour >= ?",
+            (
+                window_start.strftime(_TIMESTAMP),
+                window_start.strftime(_TIMESTAMP),
+                previous_start.strftime(_TIMESTAMP),
+            )
+        ).fetchone()
+        growth[name] = {
+            "signups": current,
+            "previous": previous,
+            "rate": round((current - previous) / previous, 4) if previous else None,
+            "per_hour": round(current / hours, 2),
+        }
+    return growth
+
+
+def fetch_analytics(
+    conn, granularity: str, since: datetime, until: datetime, top_domains: int, now: datetime
+) -> dict:
+    """Series, top domains and growth, read from rollups only (no waitlist scans)"""
+    return {
+        "series": {
+            "granularity": granularity,
+            "since": floor_time(since, granularity).strftime(_TIMESTAMP),
+            "until": until.strftime(_TIMESTAMP),
+            "buckets": fetch_series(conn, granularity, since, until),
+        },
+        "top_domains": fetch_top_domains(conn, top_domains),
+        "growth": fetch_growth(conn, now),
+    }
@@ -0,0 +1,318 @@
+"""
+Online SQLite backups: paced page copies into rotated, gzip-compressed snapshots
+"""
+import asyncio
+import fcntl
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PREFIX = "waitlist-"
+SNAPSHOT_SUFFIX = ".db.gz"
+LOCK_FILE = ".backup.lock"
+# Signup write latencies kept as the baseline a backup is compared against
+BASELINE_SAMPLES = 1000
+
+
+class BackupInProgress(Exception):
+    """Raised when another backup, in this worker or another process, is running"""
+
+
+class BackupCancelled(Exception):
+    """Raised inside a running backup when the manager is stopped"""
+
+
+def latency_summary(samples: list) -> dict:
+    """p50/p95/max in milliseconds, or None without samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "samples": len(ordered),
+        "p50_ms": round(percentile(0.50) * 1000, 2),
+        "p95_ms": round(percentile(0.95) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class BackupManager:
+    """Takes consistent snapshots of a live database without blocking writers.
+
+    The copy uses SQLite's online backup API, ``pages`` pages per step, with
+    a ``step_sleep`` pause between steps so that the copy never monopolizes
+    the disk. The source connection holds one read transaction for the
+    whole copy. In WAL mode that pins a single snapshot: signups keep
+    committing to the WAL, and the backup is not restarted by each of them.
+    The WAL cannot be checkpointed past that snapshot until the copy ends.
+
+    The copy is checked with ``PRAGMA quick_check``, gzip-compressed into
+    ``directory`` and renamed into place, and only the newest ``keep``
+    snapshots are kept. An exclusive ``flock`` on a file in ``directory``
+    makes sure only one process backs up at a time.
+
+    ``observe_write`` is fed the latency of every signup write. Each backup
+    result compares the writes made while it ran with the ones before it.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        directory: str,
+        pages: int = 256,
+        step_sleep: float = 0.01,
+        keep: int = 7,
+        compress_level: int = 6,
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = db_path
+        self.directory = directory
+        self.pages = max(1, pages)
+        self.step_sleep = step_sleep
+        self.keep = max(1, keep)
+        self.compress_level = compress_level
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self.running = False
+        self._stopping = False
+        self._task = None
+        self._baseline = deque(maxlen=BASELINE_SAMPLES)
+        self._during = None
+
+        # Stats
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.last_result = None
+        self.last_error = None
+        self.last_success_at = None
+
+    def observe_write(self, seconds: float):
+        """Record one signup write latency (thread-safe)"""
+        during = self._during
+        if during is not None:
+            during.append(seconds)
+        else:
+            self._baseline.append(seconds)
+
+    def snapshots(self) -> list:
+        """Existing snapshots, newest first"""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        snapshots = []
+        for name in sorted(names, reverse=True):
+            if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                snapshots.append({
+                    "name": name,
+                    "bytes": stat.st_size,
+                    "created_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+                })
+        return snapshots
+
+    def newest_snapshot_at(self) -> float:
+        """Modification time of the newest snapshot, or 0 without one.
+
+        Read from disk, so every worker reports the same value whichever
+        of them took the snapshot.
+        """
+        newest = self.snapshots()[:1]
+        if not newest:
+            return 0
+        try:
+            return os.path.getmtime(os.path.join(self.directory, newest[0]["name"]))
+        except FileNotFoundError:
+            return 0
+
+    def _lock(self) -> int:
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(os.path.join(self.directory, LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise BackupInProgress("Another process is already backing up the database")
+        return fd
+
+    def backup(self, max_age: float = None) -> dict:
+        """Take one snapshot. Blocking; run it off the event loop.
+
+        With ``max_age``, nothing is done (and None is returned) when the
+        newest snapshot is younger than that many seconds. The check runs
+        under the lock, so workers sharing a schedule back up only once.
+        """
+        fd = self._lock()
+        try:
+            if max_age is not None and time.time() - self.newest_snapshot_at() < max_age:
+                self.skipped += 1
+                return None
+            try:
+                result = self._backup()
+            except BackupCancelled as e:
+                self.last_error = str(e)
+                raise
+            except Exception as e:
+                self.failed += 1
+                self.last_error = str(e)
+                raise
+            self.completed += 1
+            self.last_result = result
+            self.last_error = None
+            self.last_success_at = time.time()
+            return result
+        finally:
+            os.close(fd)
+
+    def _backup(self) -> dict:
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        name = f"{SNAPSHOT_PREFIX}{now:%Y%m%d-%H%M%S-%f}{SNAPSHOT_SUFFIX}"
+        final_path = os.path.join(self.directory, name)
+        copy_path = os.path.join(self.directory, f".{name[:-len('.gz')]}.tmp")
+        gzip_path = f"{final_path}.tmp"
+        steps = 0
+        pages = 0
+
+        def progress(status, remaining, total):
+            nonlocal steps, pages
+            steps += 1
+            pages = total
+            if self._stopping:
+                raise BackupCancelled("Backup cancelled")
+            if remaining and self.step_sleep:
+                time.sleep(self.step_sleep)
+
+        self._during = []
+        try:
+            source = sqlite3.connect(
+                self.db_path, timeout=self.busy_timeout_ms / 1000, isolation_level=None
+            )
+            target = sqlite3.connect(copy_path)
+            try:
+                # Pin one WAL snapshot for the whole copy
+                source.execute("BEGIN")
+                source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+                source.backup(target, pages=self.pages, progress=progress)
+                source.execute("COMMIT")
+                copy_seconds = time.perf_counter() - started
+                check = target.execute("PRAGMA quick_check").fetchone()[0]
+                if check != "ok":
+                    raise RuntimeError(f"Snapshot failed quick_check: {check}")
+            finally:
+                target.close()
+                source.close()
+
+            compress_started = time.perf_counter()
+            with open(copy_path, "rb") as src, gzip.open(gzip_path, "wb", self.compress_level) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(gzip_path, final_path)
+            compress_seconds = time.perf_counter() - compress_started
+            database_bytes = os.path.getsize(copy_path)
+        finally:
+            during, self._during = self._during, None
+            for path in (copy_path, gzip_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        removed = self._rotate()
+        result = {
+            "name": name,
+            "bytes": os.path.getsize(final_path),
+            "database_bytes": database_bytes,
+            "pages": pages,
+            "steps": steps,
+            "copy_seconds": round(copy_seconds, 3),
+            "compress_seconds": round(compress_seconds, 3),
+            "seconds": round(time.perf_counter() - started, 3),
+            "created_at": now.isoformat(),
+            "rotated_out": removed,
+            "signup_write_latency": {
+                "during_backup": latency_summary(during),
+                "before_backup": latency_summary(list(self._baseline)),
+            },
+        }
+        logger.info(
+            f"Backup {name} written: {result['bytes']} bytes from {database_bytes} "
+            f"in {result['seconds']:.2f}s ({steps} steps)"
+        )
+        return result
+
+    def _rotate(self) -> list:
+        """Delete all but the newest ``keep`` snapshots"""
+        removed = []
+        for snapshot in self.snapshots()[self.keep:]:
+            os.remove(os.path.join(self.directory, snapshot["name"]))
+            removed.append(snapshot["name"])
+        return removed
+
+    def _launch(self, coro_fn, *args) -> asyncio.Task:
+        """Run one backup coroutine as the tracked task ``stop`` waits for"""
+        if self.running:
+            raise BackupInProgress("A backup is already running in this worker")
+        self.running = True
+        self._task = asyncio.create_task(coro_fn(*args))
+        return self._task
+
+    async def run(self, max_age: float = None) -> dict:
+        """Take a snapshot on a worker thread (see ``backup``) and wait for it.
+
+        Cancelling the caller does not cancel the backup: the thread cannot
+        be interrupted, so the tracked task runs on until ``stop`` ends it.
+        """
+        return await asyncio.shield(self._launch(self._run, max_age))
+
+    async def _run(self, max_age: float = None) -> dict:
+        try:
+            return await asyncio.to_thread(self.backup, max_age)
+        finally:
+            self.running = False
+
+    def start(self):
+        """Start a snapshot in the background; its outcome shows up in ``stats``"""
+        self._launch(self._run_logged)
+
+    async def _run_logged(self):
+        try:
+            await self._run()
+        except BackupInProgress as e:
+            self.last_error = str(e)
+            logger.warning(f"Backup skipped: {str(e)}")
+        except BackupCancelled:
+            logger.info("Backup cancelled at shutdown")
+        except Exception as e:
+            logger.error(f"Backup failed: {str(e)}")
+
+    async def stop(self):
+        """Abort a running backup at its next page step and wait for its thread to finish"""
+        self._stopping = True
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "directory": self.directory,
+            "pages_per_step": self.pages,
+            "step_sleep": self.step_sleep,
+            "keep": self.keep,
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "last_success_at": self.last_success_at,
+            "last_error": self.last_error,
+            "last_result": self.last_result,
+            "snapshots": self.snapshots(),
+        }
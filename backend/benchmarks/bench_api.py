@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+API load-test and benchmark harness
+
+Drives /api/stats, /api/waitlist, /admin/dashboard and /api/signup at a
+fixed concurrency against databases seeded with 1k to 1M rows, and reports
+throughput and p50/p95/p99 latency as JSON. Two targets are supported:
+
+    inprocess  the FastAPI app called through httpx's ASGI transport, which
+               measures the app itself without sockets or uvicorn
+    uvicorn    server.py started locally on a free port, driven over HTTP
+
+Every (target, rows) run happens in a fresh subprocess, on a copy of a seeded
+template database. Runs therefore do not share module state, and signups made
+by one run do not leak into the next. Rate limits are disabled
+(RATE_LIMIT_ENABLED=0) and the seeding RNG is fixed, so repeated runs
+measure the same workload.
+
+Requires httpx (pip install -r benchmarks/requirements.txt).
+
+Usage (from backend/):
+    python benchmarks/bench_api.py [--targets inprocess,uvicorn] [--rows 1000,100000,1000000]
+        [--concurrency 16] [--requests 2000] [--endpoints stats,waitlist,dashboard,signup]
+        [--workers 1] [--data-dir DIR] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+ENDPOINTS = ("stats", "waitlist", "dashboard", "signup")
+SEED = 1234
+ADMIN_USERNAME = "bench-admin"
+ADMIN_PASSWORD = "bench-password"
+
+
+def bench_env(db_path: str) -> dict:
+    """Environment shared by every benchmark subprocess"""
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_PATH": db_path,
+        "RATE_LIMIT_ENABLED": "0",
+        "PROFILE_SAMPLE_RATE": "0",
+        "COUNTER_RECONCILE_INTERVAL": "86400",
+        "ADMIN_USERNAME": ADMIN_USERNAME,
+        "ADMIN_PASSWORD": ADMIN_PASSWORD,
+        "PYTHONPATH": BACKEND_DIR,
+    })
+    env.pop("WAITLIST_SCHEMA_READY", None)
+    return env
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+# --- seeding -----------------------------------------------------------------
+
+def seed_database(rows: int):
+    """Create the schema with main.init_db() and insert ``rows`` signups"""
+    import main
+    from analytics import add_to_rollups, last_signup_id
+    from validation import canonical_email
+
+    main.init_db()
+    rng = random.Random(SEED)
+    now = datetime.now(timezone.utc)
+
+    def generate():
+        for i in range(rows):
+            email = f"seed{i}@example{i % 50}.com"
+            if rng.random() < 0.4:
+                domain = f"site{i % 1000}.com"
+                website = f"https://{domain}/"
+            else:
+                domain = None
+                website = ""
+            created_at = now - timedelta(seconds=rng.randint(0, 90 * 86400))
+            yield email, website, domain, canonical_email(email), created_at.strftime("%Y-%m-%d %H:%M:%S")
+
+    with main.db_pool.connection() as conn:
+        after_id = last_signup_id(conn)
+        conn.executemany(
+            "INSERT INTO waitlist (email, website, website_domain, email_canonical, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            generate()
+        )
+        add_to_rollups(conn, after_id)
+        conn.commit()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    main.db_pool.close()
+
+
+def seeded_template(data_dir: str, rows: int) -> str:
+    """Path to a seeded template database, creating it on first use"""
+    path = os.path.join(data_dir, f"seed-{rows}.db")
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "_seed", "--rows", str(rows)],
+            env=bench_env(path + ".tmp"), cwd=BACKEND_DIR, check=True,
+            stderr=subprocess.DEVNULL
+        )
+        os.replace(path + ".tmp", path)
+        print(f"Seeded {rows} rows in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+# --- load generation ---------------------------------------------------------
+
+async def drive(client, endpoint: str, requests: int, concurrency: int, rows: int, cursors: list) -> dict:
+    """Issue ``requests`` calls to one endpoint from ``concurrency`` workers"""
+    rng = random.Random(SEED)
+    latencies = []
+    errors = 0
+    issued = 0
+
+    def next_request(i: int):
+        if endpoint == "stats":
+            return "GET", "/api/stats", None
+        if endpoint == "waitlist":
+            cursor = cursors[i % len(cursors)] if cursors else None
+            return "GET", "/api/waitlist", {"limit": 50, **({"cursor": cursor} if cursor else {})}
+        if endpoint == "dashboard":
+            cursor = cursors[i % len(cursors)] if cursors else None
+            return "GET", "/admin/dashboard", {"limit": 50, **({"cursor": cursor} if cursor else {})}
+        # One in five signups repeats an existing address, like refreshes during a launch
+        if rows and rng.random() < 0.2:
+            n = rng.randrange(rows)
+            email = f"seed{n}@example{n % 50}.com"
+        else:
+            email = f"bench{i}-{rng.getrandbits(32):08x}@loadtest.dev"
+        return "POST", "/api/signup", {"email": email, "website": "https://loadtest.dev"}
+
+    async def worker():
+        nonlocal errors, issued
+        while issued < requests:
+            i = issued
+            issued += 1
+            method, path, params = next_request(i)
+            started = time.perf_counter()
+            try:
+                if method == "POST":
+                    response = await client.post(path, json=params)
+                else:
+                    response = await client.get(path, params=params)
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+            "p50": round(percentile(latencies, 0.50) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3),
+        },
+    }
+
+
+async def run_suite(client, args) -> list:
+    """Log in, collect pagination cursors, then benchmark each endpoint in turn"""
+    await client.post("/admin/login", data={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD})
+
+    # Walk the first pages once so waitlist/dashboard requests spread over real cursors
+    cursors = [None]
+    for _ in range(19):
+        page = (await client.get("/api/waitlist", params={"limit": 50, **(
+            {"cursor": cursors[-1]} if cursors[-1] else {}
+        )})).json()
+        if not page.get("next_cursor"):
+            break
+        cursors.append(page["next_cursor"])
+
+    # Warm up connections and caches
+    for endpoint in args.endpoints:
+        if endpoint != "signup":
+            await drive(client, endpoint, min(100, args.requests), args.concurrency, args.rows, cursors)
+
+    # Signups change the data, so they run last
+    ordered = [e for e in args.endpoints if e != "signup"] + [e for e in args.endpoints if e == "signup"]
+    return [
+        await drive(client, endpoint, args.requests, args.concurrency, args.rows, cursors)
+        for endpoint in ordered
+    ]
+
+
+async def run_inprocess(args) -> list:
+    import httpx
+    import main
+
+    async with main.app.router.lifespan_context(main.app):
+        # Let the duplicate filter finish warming before measuring
+        while not main.duplicate_filter.ready:
+            await asyncio.sleep(0.05)
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            return await run_suite(client, args)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_uvicorn(args) -> list:
+    import httpx
+
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), API_HOST="127.0.0.1", WEB_CONCURRENCY=str(args.workers))
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(BACKEND_DIR, "server.py")],
+        env=env, cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+            deadline = time.monotonic() + 120
+            while True:
+                try:
+                    if (await client.get("/api")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                await asyncio.sleep(0.2)
+            # Give each worker's duplicate filter time to warm
+            await asyncio.sleep(min(10, 1 + args.rows / 200000))
+            return await run_suite(client, args)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def run_one(args):
+    """Subprocess entry point: benchmark one target against DATABASE_PATH"""
+    runner = run_inprocess if args.target == "inprocess" else run_uvicorn
+    results = asyncio.run(runner(args))
+    print(json.dumps(results))
+
+
+# --- orchestration -----------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--targets", default="inprocess,uvicorn")
+    parser.add_argument("--rows", default="1000,100000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per endpoint")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--data-dir", help="where seeded databases are cached (default: a temp dir)")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    # Internal subcommands used for the per-run subprocesses
+    parser.add_argument("mode", nargs="?", default="bench", choices=["bench", "_seed", "_run"])
+    parser.add_argument("--target", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode == "_seed":
+        seed_database(int(args.rows))
+        return
+    args.endpoints = [e for e in args.endpoints.split(",") if e]
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+    if args.mode == "_run":
+        args.rows = int(args.rows)
+        run_one(args)
+        return
+
+    targets = [t for t in args.targets.split(",") if t]
+    row_counts = [int(r) for r in args.rows.split(",") if r]
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="waitlist-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+
+    report = {
+        "config": {
+            "targets": targets,
+            "rows": row_counts,
+            "concurrency": args.concurrency,
+            "requests_per_endpoint": args.requests,
+            "endpoints": args.endpoints,
+            "uvicorn_workers": args.workers,
+            "python": sys.version.split()[0],
+            "cpus": os.cpu_count(),
+        },
+        "runs": [],
+    }
+    try:
+        for rows in row_counts:
+            template = seeded_template(data_dir, rows)
+            for target in targets:
+                run_db = os.path.join(data_dir, f"run-{target}-{rows}.db")
+                for suffix in ("", "-wal", "-shm"):
+                    if os.path.exists(run_db + suffix):
+                        os.remove(run_db + suffix)
+                shutil.copyfile(template, run_db)
+                print(f"Running {target} against {rows} rows", file=sys.stderr)
+                completed = subprocess.run(
+                    [
+                        sys.executable, os.path.abspath(__file__), "_run",
+                        "--target", target, "--rows", str(rows),
+                        "--concurrency", str(args.concurrency), "--requests", str(args.requests),
+                        "--endpoints", ",".join(args.endpoints), "--workers", str(args.workers),
+                    ],
+                    env=bench_env(run_db), cwd=BACKEND_DIR, check=True,
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+                )
+                for result in json.loads(completed.stdout.strip().splitlines()[-1]):
+                    report["runs"].append({"target": target, "rows": rows, **result})
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
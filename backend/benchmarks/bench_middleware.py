@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Security/session middleware overhead benchmark
+
+Calls a minimal /api/stats-style endpoint directly over ASGI, with no sockets
+or HTTP client, through three middleware stacks:
+
+    none    no middleware
+    legacy  the previous BaseHTTPMiddleware security headers and the plain
+            SessionMiddleware
+    asgi    the pure ASGI SecurityHeadersMiddleware and PublicPathSessionMiddleware
+
+Every request carries a signed session cookie, as it would for an admin who
+is browsing the public site.
+
+Usage (from backend/): python benchmarks/bench_middleware.py [--requests N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.middleware.sessions import SessionMiddleware  # noqa: E402
+
+from security import DEFAULT_CSP, PublicPathSessionMiddleware, add_security_middleware  # noqa: E402
+
+SECRET = "bench-secret"
+BODY = b'{"total_signups": 12345}'
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """The headers middleware as it was before the pure ASGI rewrite"""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Content-Security-Policy"] = DEFAULT_CSP
+        if request.url.scheme == "https":
+            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/stats")
+    async def stats():
+        return Response(content=BODY, media_type="application/json")
+
+    @app.get("/cookie")
+    async def cookie(request: Request):
+        request.session["admin_authenticated"] = True
+        return Response(b"ok")
+
+    if stack == "legacy":
+        app.add_middleware(SessionMiddleware, secret_key=SECRET)
+        app.add_middleware(LegacySecurityHeadersMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(PublicPathSessionMiddleware, secret_key=SECRET)
+        add_security_middleware(app)
+    return app
+
+
+async def call(app, path: str, cookie: bytes = b""):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+        "headers": [(b"host", b"testserver")] + ([(b"cookie", cookie)] if cookie else []),
+    }
+    sent = []
+    received = False
+    finished = asyncio.Event()
+
+    async def receive():
+        # One empty request body, then a disconnect once the response is done
+        nonlocal received
+        if received:
+            await finished.wait()
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            finished.set()
+
+    await app(scope, receive, send)
+    return sent
+
+
+async def session_cookie() -> bytes:
+    """A real signed session cookie, issued by SessionMiddleware"""
+    sent = await call(build_app("legacy"), "/cookie")
+    for name, value in sent[0]["headers"]:
+        if name == b"set-cookie":
+            return value.split(b";", 1)[0]
+    raise RuntimeError("no session cookie issued")
+
+
+async def time_stack(stack: str, requests: int, cookie: bytes) -> dict:
+    app = build_app(stack)
+    # Build the middleware stack and warm up code paths
+    for _ in range(200):
+        await call(app, "/api/stats", cookie)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call(app, "/api/stats", cookie)
+    elapsed = time.perf_counter() - started
+    return {
+        "stack": stack,
+        "requests": requests,
+        "us_per_request": round(elapsed / requests * 1e6, 2),
+        "requests_per_second": round(requests / elapsed),
+    }
+
+
+async def run(requests: int) -> dict:
+    cookie = await session_cookie()
+    results = [await time_stack(stack, requests, cookie) for stack in ("none", "legacy", "asgi")]
+    baseline = results[0]["us_per_request"]
+    for result in results:
+        result["middleware_overhead_us"] = round(result["us_per_request"] - baseline, 2)
+    return {"results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
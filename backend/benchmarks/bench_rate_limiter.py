@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Rate limiter storage benchmark
+
+Measures the per-request cost of a fixed-window limit check (what slowapi
+runs on every limited request) for in-memory and SQLite storage. It then
+checks that the SQLite storage enforces one limit across several processes.
+
+Usage (from backend/): python benchmarks/bench_rate_limiter.py [--hits N] [--processes P]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from limits import parse  # noqa: E402
+from limits.storage import storage_from_string  # noqa: E402
+from limits.strategies import FixedWindowRateLimiter  # noqa: E402
+
+import rate_limit_storage  # noqa: E402,F401
+
+
+def time_hits(uri: str, hits: int, distinct_keys: int = 1000) -> dict:
+    """Average cost of limiter.hit() over many clients for one storage URI"""
+    limiter = FixedWindowRateLimiter(storage_from_string(uri))
+    item = parse("1000000/minute")
+    # Warm up connections and code paths
+    for i in range(100):
+        limiter.hit(item, "warmup", str(i))
+
+    started = time.perf_counter()
+    for i in range(hits):
+        limiter.hit(item, "bench", str(i % distinct_keys))
+    elapsed = time.perf_counter() - started
+    return {
+        "storage": uri.split("://", 1)[0],
+        "hits": hits,
+        "us_per_hit": round(elapsed / hits * 1e6, 2),
+        "hits_per_second": round(hits / elapsed),
+    }
+
+
+def _hammer(uri: str, attempts: int, limit: str, results):
+    limiter = FixedWindowRateLimiter(storage_from_string(uri))
+    item = parse(limit)
+    allowed = sum(1 for _ in range(attempts) if limiter.hit(item, "shared", "127.0.0.1"))
+    results.put(allowed)
+
+
+def cross_process_check(uri: str, processes: int, attempts: int, limit_count: int) -> dict:
+    """Run several processes against one key and count how many hits got through"""
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=_hammer, args=(uri, attempts, f"{limit_count}/minute", results))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    allowed = sum(results.get() for _ in workers)
+    return {
+        "storage": uri.split("://", 1)[0],
+        "processes": processes,
+        "limit": limit_count,
+        "allowed": allowed,
+        "enforced": allowed == limit_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hits", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_uri = f"sqlite:///{os.path.join(tmp, 'ratelimits.db')}"
+        report = {
+            "per_request": [
+                time_hits("memory://", args.hits),
+                time_hits(sqlite_uri, args.hits),
+            ],
+            "cross_process": [
+                cross_process_check(sqlite_uri, args.processes, attempts=50, limit_count=30),
+            ],
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Email validation benchmark
+
+Times the shared validation pipeline (validate_email, which includes the
+disposable-domain lookup and canonical form) over a generated address set,
+next to the inline checks the signup handler used to run. Duplicate
+detection itself is one probe of the unique email_canonical index, so it is
+not measured here.
+
+Usage (from backend/): python benchmarks/bench_validation.py [--count N]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import InvalidEmail, canonical_email, is_disposable, validate_email  # noqa: E402
+
+DOMAINS = [
+    "gmail.com", "googlemail.com", "outlook.com", "yahoo.com", "example.org",
+    "mail.company.co.uk", "mailinator.com", "startup.io", "uni.edu", "proton.me",
+]
+
+
+def generate_addresses(count: int, seed: int = 42) -> list:
+    """Mostly valid addresses with dots, +tags, mixed case and some junk"""
+    rng = random.Random(seed)
+    addresses = []
+    for i in range(count):
+        local = f"user{i}"
+        if rng.random() < 0.3:
+            local = f"first.{local}"
+        if rng.random() < 0.2:
+            local += f"+tag{rng.randint(1, 9)}"
+        address = f"  {local}@{rng.choice(DOMAINS)} "
+        roll = rng.random()
+        if roll < 0.05:
+            address = address.replace("@", "")
+        elif roll < 0.08:
+            address = address.replace(".", "..", 1)
+        elif roll < 0.5:
+            address = address.upper()
+        addresses.append(address)
+    return addresses
+
+
+def legacy_check(raw: str):
+    """The checks signup used to run inline"""
+    email = raw.lower().strip()
+    if not email or "@" not in email or email.count("@") != 1 or ".." in email:
+        return None
+    return email
+
+
+def pipeline_check(raw: str):
+    try:
+        return validate_email(raw)
+    except InvalidEmail:
+        return None
+
+
+def time_function(name: str, fn, addresses: list) -> dict:
+    fn(addresses[0])
+    started = time.perf_counter()
+    accepted = sum(1 for address in addresses if fn(address) is not None)
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "addresses": len(addresses),
+        "accepted": accepted,
+        "us_per_address": round(elapsed / len(addresses) * 1e6, 3),
+        "addresses_per_second": round(len(addresses) / elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    addresses = generate_addresses(args.count)
+    lowered = [address.strip().lower() for address in addresses]
+    domains = [address.rpartition("@")[2] for address in lowered]
+
+    report = {
+        "results": [
+            time_function("legacy_inline_checks", legacy_check, addresses),
+            time_function("validate_email", pipeline_check, addresses),
+            time_function("canonical_email", canonical_email, lowered),
+            time_function("is_disposable", lambda d: is_disposable(d) or None, domains),
+        ],
+        "is_disposable_cache": is_disposable.cache_info()._asdict(),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+In-process broadcaster for the live signup counter (Server-Sent Events)
+"""
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StatsBroadcaster:
+    """Fans the latest signup total out to every connected stream.
+
+    Subscribers hold no queue. Each one remembers the last version it sent
+    and waits on one shared event that is swapped on every update. Memory
+    per idle connection is therefore constant, and slow clients skip
+    straight to the newest total rather than buffering old ones.
+
+    ``publish`` is cheap and may be called on every signup. Updates are
+    coalesced so that at most ``max_updates_per_second`` go out. While
+    anyone is subscribed, the counter is also re-read every
+    ``poll_interval`` seconds, which picks up signups handled by other
+    workers. That costs one query per worker, however many clients there
+    are.
+    """
+
+    def __init__(
+        self,
+        fetch_total,
+        max_updates_per_second: float = 2.0,
+        poll_interval: float = 5.0,
+        keepalive: float = 15.0,
+        max_clients: int = 5000,
+    ):
+        self.fetch_total = fetch_total
+        self.min_interval = 1.0 / max_updates_per_second if max_updates_per_second > 0 else 0.0
+        self.poll_interval = poll_interval
+        self.keepalive = keepalive
+        self.max_clients = max_clients
+
+        self.total = None
+        self.version = 0
+        self.clients = 0
+        self._closed = False
+        self._changed = None
+        self._pending = None
+        self._flush_handle = None
+        self._last_emit = 0.0
+        self._poll_task = None
+        self._refresh_tasks = set()
+        self._stale = True
+
+        # Stats
+        self.published = 0
+        self.emitted = 0
+        self.rejected = 0
+
+    async def start(self):
+        """Create loop-bound state and start polling"""
+        self._closed = False
+        self._changed = asyncio.Event()
+        self._poll_task = asyncio.create_task(self._poll())
+
+    async def stop(self):
+        """Stop polling and end every open stream"""
+        self._closed = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        for task in self._refresh_tasks:
+            task.cancel()
+        if self._changed is not None:
+            self._changed.set()
+
+    @property
+    def full(self) -> bool:
+        return self.clients >= self.max_clients
+
+    def publish(self, total: int):
+        """Record a new total; subscribers see it within one coalescing interval"""
+        if self._changed is None or self._closed:
+            return
+        self.published += 1
+        self._pending = total
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            delay = max(0.0, self._last_emit + self.min_interval - loop.time())
+            self._flush_handle = loop.call_later(delay, self._flush)
+
+    def _flush(self):
+        self._flush_handle = None
+        total, self._pending = self._pending, None
+        if total is not None and total != self.total:
+            self._emit(total)
+
+    def _emit(self, total: int):
+        self.total = total
+        self.version += 1
+        self.emitted += 1
+        self._last_emit = asyncio.get_running_loop().time()
+        event, self._changed = self._changed, asyncio.Event()
+        event.set()
+
+    def refresh(self):
+        """Re-read the total in the background, e.g. after a bulk write"""
+        if self.clients and self._changed is not None and not self._closed:
+            # Hold a reference so the task is not garbage-collected mid-flight
+            task = asyncio.create_task(self._refresh())
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self):
+        try:
+            self.publish(await self.fetch_total())
+        except Exception as e:
+            logger.warning(f"Live counter refresh failed: {str(e)}")
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if self.clients:
+                await self._refresh()
+
+    def try_subscribe(self):
+        """Reserve a stream slot and return its ``Subscription``, or None (counted as rejected) when full"""
+        if self.full:
+            self.rejected += 1
+            return None
+        self.clients += 1
+        return Subscription(self)
+
+    def _release(self):
+        self.clients -= 1
+        if not self.clients:
+            # Nobody is listening, so the cached total may miss other workers' signups
+            self._stale = True
+
+    async def _updates(self):
+        """Yield ``(version, total)`` on every change, or None as a keepalive tick.
+
+        The current total is yielded first.
+        """
+        if self.total is None or self._stale:
+            self._stale = False
+            total = await self.fetch_total()
+            if total != self.total:
+                self._emit(total)
+        sent = None
+        while not self._closed:
+            if self.version != sent:
+                sent = self.version
+                yield sent, self.total
+                continue
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.keepalive)
+            except asyncio.TimeoutError:
+                yield None
+
+    def stats(self) -> dict:
+        return {
+            "clients": self.clients,
+            "max_clients": self.max_clients,
+            "total": self.total,
+            "version": self.version,
+            "published": self.published,
+            "emitted": self.emitted,
+            "rejected": self.rejected,
+        }
+
+
+class Subscription:
+    """One reserved stream slot, iterated for ``StatsBroadcaster`` updates.
+
+    The slot is released exactly once: when iteration ends or fails
+    (including cancellation on disconnect), on ``aclose()``, or when the
+    object is dropped without ever being iterated.
+    """
+
+    def __init__(self, broadcaster: StatsBroadcaster):
+        self._broadcaster = broadcaster
+        self._updates = broadcaster._updates()
+        self._held = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self._updates.__anext__()
+        except BaseException:
+            self.release()
+            raise
+
+    async def aclose(self):
+        try:
+            await self._updates.aclose()
+        finally:
+            self.release()
+
+    def release(self):
+        if self._held:
+            self._held = False
+            self._broadcaster._release()
+
+    def __del__(self):
+        self.release()
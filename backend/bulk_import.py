@@ -0,0 +1,134 @@
+"""
+Bulk waitlist import: streamed CSV/NDJSON parsing and chunked inserts
+"""
+import codecs
+import csv
+import json
+
+from analytics import add_to_rollups, last_signup_id
+
+# Valid rows inserted per transaction
+IMPORT_CHUNK_SIZE = 5000
+# Bound parameters per IN (...) probe; old SQLite builds cap this at 999
+_PROBE_SIZE = 500
+
+INSERTED = 0
+DUPLICATE = 1
+INVALID = 2
+STATUS_NAMES = ("inserted", "duplicate", "invalid")
+
+
+async def aiter_lines(chunks):
+    """Split an async stream of byte chunks into decoded text lines"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+class RecordParser:
+    """Turns CSV or NDJSON lines into raw ``(email, website)`` pairs.
+
+    CSV input may start with a header row naming ``email`` and optionally
+    ``website`` columns; without one, the first two columns are used.
+    ``parse`` returns None for lines that cannot be parsed and False for a
+    CSV header row.
+    """
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self._email_col = 0
+        self._website_col = 1
+        self._first = True
+
+    def parse(self, line: str):
+        if self.fmt == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                return None
+            if not isinstance(record, dict) or not isinstance(record.get("email"), str):
+                return None
+            website = record.get("website")
+            return record["email"], website if isinstance(website, str) else ""
+
+        try:
+            fields = next(csv.reader([line]))
+        except (csv.Error, StopIteration):
+            return None
+        if self._first:
+            self._first = False
+            header = [field.strip().lower() for field in fields]
+            if "email" in header:
+                self._email_col = header.index("email")
+                self._website_col = header.index("website") if "website" in header else None
+                return False
+        if len(fields) <= self._email_col:
+            return None
+        website = ""
+        if self._website_col is not None and len(fields) > self._website_col:
+            website = fields[self._website_col]
+        return fields[self._email_col], website
+
+
+def insert_chunk(conn, rows) -> list:
+    """Insert ``(email, website, website_domain, email_canonical)`` rows in one transaction.
+
+    Returns INSERTED or DUPLICATE for each row, where duplicates are matched
+    on the canonical email. Runs on the signup writer, so the existence probe
+    and the insert see the same database state.
+    """
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        emails = list({row[3] for row in rows})
+        existing = set()
+        for start in range(0, len(emails), _PROBE_SIZE):
+            batch = emails[start:start + _PROBE_SIZE]
+            cursor.execute(
+                f"SELECT email_canonical FROM waitlist "
+                f"WHERE email_canonical IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            existing.update(email for (email,) in cursor.fetchall())
+
+        statuses = []
+        new_rows = []
+        for row in rows:
+            if row[3] in existing:
+                statuses.append(DUPLICATE)
+            else:
+                # Later repeats of the same address within the upload are duplicates too
+                existing.add(row[3])
+                statuses.append(INSERTED)
+                new_rows.append(row)
+        after_id = last_signup_id(cursor)
+        cursor.executemany(
+            "INSERT OR IGNORE INTO waitlist "
+            "(email, website, website_domain, email_canonical) VALUES (?, ?, ?, ?)",
+            new_rows
+        )
+        add_to_rollups(cursor, after_id)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return statuses
+
+
+def result_chunks(summary: dict, statuses: bytearray, lines_per_chunk: int = 10000):
+    """NDJSON response body: a summary line, then one line per data row"""
+    yield (json.dumps({"summary": summary}) + "\n").encode()
+    templates = [f'{{"row":%d,"status":"{name}"}}\n' for name in STATUS_NAMES]
+    for start in range(0, len(statuses), lines_per_chunk):
+        end = min(start + lines_per_chunk, len(statuses))
+        yield "".join(
+            templates[statuses[i]] % (i + 1) for i in range(start, end)
+        ).encode()
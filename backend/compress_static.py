@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Build step: write precompressed .gz/.br variants next to frontend build files
+
+Usage: python compress_static.py [dist_dir]
+"""
+import gzip
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip variants are still produced
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = {
+    ".html", ".js", ".mjs", ".css", ".svg", ".json", ".txt", ".map", ".xml", ".ico", ".webmanifest",
+}
+# Below this size compression rarely pays for the extra header
+MIN_SIZE = 256
+
+
+def compress_file(path: str) -> list:
+    """Write compressed variants of one file; returns the suffixes written"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    written = []
+    variants = [(".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", lambda d: brotli.compress(d, quality=11)))
+
+    for suffix, compress in variants:
+        compressed = compress(data)
+        # Only keep variants that are actually smaller
+        if len(compressed) >= len(data):
+            continue
+        with open(path + suffix, "wb") as f:
+            f.write(compressed)
+        stat = os.stat(path)
+        os.utime(path + suffix, (stat.st_atime, stat.st_mtime))
+        written.append(suffix)
+    return written
+
+
+def compress_dist(dist_dir: str) -> int:
+    """Compress every eligible file under dist_dir; returns the number of files processed"""
+    count = 0
+    for root, _, files in os.walk(dist_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            if os.path.getsize(path) < MIN_SIZE:
+                continue
+            compress_file(path)
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    dist = sys.argv[1] if len(sys.argv) > 1 else os.path.join("..", "frontend", "dist")
+    if not os.path.isdir(dist):
+        sys.exit(f"Frontend build not found at {dist}")
+    processed = compress_dist(dist)
+    print(f"Precompressed {processed} files in {dist}" + ("" if brotli else " (gzip only, brotli not installed)"))
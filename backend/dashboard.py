@@ -0,0 +1,222 @@
+"""
+Precompiled admin dashboard template and rendered-page cache
+"""
+import html
+from collections import OrderedDict
+from string import Template
+from urllib.parse import urlencode
+
+DASHBOARD_TEMPLATE = Template("""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Website Union - Admin Panel</title>
+        <script src="https://cdn.tailwindcss.com"></script>
+        <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    </head>
+    <body class="bg-gray-100 min-h-screen">
+        <div class="max-w-7xl mx-auto py-8 px-4 sm:px-6 lg:px-8">
+            <!-- Header -->
+            <div class="mb-8">
+                <div class="flex items-center justify-between">
+                    <div>
+                        <h1 class="text-3xl font-bold text-gray-900">Admin Panel</h1>
+                        <p class="mt-2 text-gray-600">Website Union Waitlist Management</p>
+                    </div>
+                    <div class="flex space-x-4">
+                        <a href="/admin/export.csv" class="bg-green-500 hover:bg-green-600 text-white px-4 py-2 rounded-lg flex items-center space-x-2">
+                            <i class="fas fa-download"></i>
+                            <span>Export CSV</span>
+                        </a>
+                        <button onclick="window.location.reload()" class="bg-blue-500 hover:bg-blue-600 text-white px-4 py-2 rounded-lg flex items-center space-x-2">
+                            <i class="fas fa-refresh"></i>
+                            <span>Refresh</span>
+                        </button>
+                        <a href="/admin/logout" class="bg-red-500 hover:bg-red-600 text-white px-4 py-2 rounded-lg flex items-center space-x-2">
+                            <i class="fas fa-sign-out-alt"></i>
+                            <span>Logout</span>
+                        </a>
+                    </div>
+                </div>
+            </div>
+
+            <!-- Stats Cards -->
+            <div class="grid grid-cols-1 md:grid-cols-3 gap-6 mb-8">
+                <div class="bg-white rounded-lg shadow p-6">
+                    <div class="flex items-center">
+                        <div class="p-3 rounded-full bg-blue-100">
+                            <i class="fas fa-users text-blue-600 text-xl"></i>
+                        </div>
+                        <div class="ml-4">
+                            <p class="text-sm font-medium text-gray-600">Total Signups</p>
+                            <p class="text-2xl font-bold text-gray-900">$total_signups</p>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="bg-white rounded-lg shadow p-6">
+                    <div class="flex items-center">
+                        <div class="p-3 rounded-full bg-green-100">
+                            <i class="fas fa-globe text-green-600 text-xl"></i>
+                        </div>
+                        <div class="ml-4">
+                            <p class="text-sm font-medium text-gray-600">With Websites</p>
+                            <p class="text-2xl font-bold text-gray-900">$with_websites</p>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="bg-white rounded-lg shadow p-6">
+                    <div class="flex items-center">
+                        <div class="p-3 rounded-full bg-purple-100">
+                            <i class="fas fa-calendar text-purple-600 text-xl"></i>
+                        </div>
+                        <div class="ml-4">
+                            <p class="text-sm font-medium text-gray-600">Latest Signup</p>
+                            <p class="text-sm font-bold text-gray-900">$latest_signup</p>
+                        </div>
+                    </div>
+                </div>
+            </div>
+
+            <!-- Table -->
+            <div class="bg-white shadow rounded-lg overflow-hidden">
+                <div class="px-6 py-4 border-b border-gray-200">
+                    <h2 class="text-lg font-semibold text-gray-900">Waitlist Entries</h2>
+                </div>
+
+                <div class="overflow-x-auto">
+                    <table class="min-w-full divide-y divide-gray-200">
+                        <thead class="bg-gray-50">
+                            <tr>
+                                <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">#</th>
+                                <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Email</th>
+                                <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Website</th>
+                                <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Joined</th>
+                            </tr>
+                        </thead>
+                        <tbody class="bg-white divide-y divide-gray-200">
+                            $table_rows
+                        </tbody>
+                    </table>
+                </div>
+                $pagination
+            </div>
+        </div>
+    </body>
+    </html>
+""")
+
+ROW_TEMPLATE = Template("""
+                        <tr class="border-b border-gray-200 hover:bg-gray-50">
+                            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">$index</td>
+                            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">$email</td>
+                            <td class="px-6 py-4 whitespace-nowrap text-sm text-blue-600">
+                                $website
+                            </td>
+                            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">$created_at</td>
+                        </tr>""")
+
+WEBSITE_LINK_TEMPLATE = Template(
+    '<a href="$url" target="_blank" rel="noopener noreferrer" class="hover:underline">$url</a>'
+)
+
+EMPTY_ROWS = '<tr><td colspan="4" class="px-6 py-4 text-center text-gray-500">No signups yet</td></tr>'
+
+PAGINATION_TEMPLATE = Template("""
+            <div class="px-6 py-4 border-t border-gray-200 flex items-center justify-between text-sm">
+                <span class="text-gray-600">Showing $first&ndash;$last of $total_signups</span>
+                <div class="flex space-x-4">
+                    $links
+                </div>
+            </div>""")
+
+PAGE_LINK_TEMPLATE = Template('<a href="$href" class="text-blue-500 hover:text-blue-600">$label</a>')
+
+
+def render_website(website: str) -> str:
+    """Website cell contents; only http(s) URLs become links"""
+    if not website:
+        return "Not provided"
+    escaped = html.escape(website)
+    if website.lower().startswith(("http://", "https://")):
+        return WEBSITE_LINK_TEMPLATE.substitute(url=escaped)
+    return escaped
+
+
+def render_dashboard(
+    total_signups: int,
+    with_websites: int,
+    latest_signup,
+    rows,
+    start: int,
+    limit: int,
+    next_cursor: str = None,
+) -> str:
+    """Render one dashboard page; ``rows`` are (id, email, website, created_at) tuples"""
+    table_rows = "".join(
+        ROW_TEMPLATE.substitute(
+            index=index,
+            email=html.escape(email),
+            website=render_website(website),
+            created_at=html.escape(str(created_at)),
+        )
+        for index, (_, email, website, created_at) in enumerate(rows, start)
+    )
+
+    links = []
+    if start > 1:
+        links.append(PAGE_LINK_TEMPLATE.substitute(
+            href=f"/admin/dashboard?{urlencode({'limit': limit})}", label="First page"
+        ))
+    if next_cursor:
+        query = urlencode({"cursor": next_cursor, "limit": limit, "start": start + len(rows)})
+        links.append(PAGE_LINK_TEMPLATE.substitute(
+            href=html.escape(f"/admin/dashboard?{query}"), label="Next page &rarr;"
+        ))
+    pagination = PAGINATION_TEMPLATE.substitute(
+        first=start if rows else 0,
+        last=start + len(rows) - 1 if rows else 0,
+        total_signups=total_signups,
+        links="".join(links),
+    )
+
+    return DASHBOARD_TEMPLATE.substitute(
+        total_signups=total_signups,
+        with_websites=with_websites,
+        latest_signup=html.escape(str(latest_signup)) if latest_signup else "None",
+        table_rows=table_rows or EMPTY_ROWS,
+        pagination=pagination,
+    )
+
+
+class DashboardCache:
+    """Rendered dashboard pages, valid until the next waitlist write.
+
+    Entries are tagged with the write version from ``waitlist_stats``; a
+    version change drops every cached page at once.
+    """
+
+    def __init__(self, max_pages: int = 32):
+        self.max_pages = max_pages
+        self._version = None
+        self._pages = OrderedDict()
+
+    def get(self, version: int, key):
+        if version != self._version:
+            return None
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+        return page
+
+    def put(self, version: int, key, page: str):
+        if version != self._version:
+            self._version = version
+            self._pages.clear()
+        self._pages[key] = page
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
@@ -0,0 +1,200 @@
+"""
+Pooled SQLite connection layer
+"""
+import asyncio
+import contextvars
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes free within the checkout timeout"""
+
+
+class ConnectionPool:
+    """Fixed-size pool of long-lived SQLite connections in WAL mode.
+
+    Connections are opened lazily up to ``size`` and reused across requests,
+    so the per-connection PRAGMAs and the prepared statement cache survive
+    between requests. Checkout is thread-safe, which makes the pool usable
+    from FastAPI's threadpool for sync endpoints. ``on_checkout``, if given,
+    is called with the seconds each checkout took.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int = 5,
+        busy_timeout_ms: int = 5000,
+        checkout_timeout: float = 10.0,
+        statement_cache_size: int = 128,
+        on_checkout=None,
+    ):
+        self.path = path
+        self.size = max(1, size)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.checkout_timeout = checkout_timeout
+        self.statement_cache_size = statement_cache_size
+        self.on_checkout = on_checkout
+
+        self._idle = []
+        self._open_count = 0
+        self._cond = threading.Condition(threading.Lock())
+
+        # Stats
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.statement_cache_size,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+
+    def dedicated(self) -> sqlite3.Connection:
+        """A connection configured like pooled ones but outside the pool; the caller closes it"""
+        return self._open()
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._cond:
+            self._checkouts += 1
+            if self._idle:
+                return self._idle.pop()
+            if self._open_count < self.size:
+                # Reserve the slot before releasing the lock to open the file
+                self._open_count += 1
+                reserved = True
+            else:
+                reserved = False
+                self._waits += 1
+                started = time.perf_counter()
+                deadline = started + self.checkout_timeout
+                while not self._idle:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        self._wait_seconds += time.perf_counter() - started
+                        raise PoolTimeout(
+                            f"No database connection available after {self.checkout_timeout}s"
+                        )
+                    self._cond.wait(remaining)
+                self._wait_seconds += time.perf_counter() - started
+                return self._idle.pop()
+
+        if reserved:
+            try:
+                return self._open()
+            except Exception:
+                with self._cond:
+                    self._open_count -= 1
+                    self._cond.notify()
+                raise
+
+    def _release(self, conn: sqlite3.Connection):
+        # Never hand a connection with a dangling transaction to the next caller
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error as e:
+                logger.warning(f"Discarding pooled connection after failed rollback: {str(e)}")
+                conn.close()
+                with self._cond:
+                    self._open_count -= 1
+                    self._cond.notify()
+                return
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out of the pool"""
+        started = time.perf_counter()
+        conn = self._acquire()
+        if self.on_checkout is not None:
+            self.on_checkout(time.perf_counter() - started)
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def stats(self) -> dict:
+        """Snapshot of pool usage counters"""
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "size": self.size,
+                "open_connections": self._open_count,
+                "idle_connections": idle,
+                "in_use_connections": self._open_count - idle,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_time_ms": round(self._wait_seconds * 1000, 3),
+                "timeouts": self._timeouts,
+            }
+
+    def close(self):
+        """Close all idle connections"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open_count -= len(idle)
+        for conn in idle:
+            conn.close()
+
+
+class AsyncDatabase:
+    """Async facade over a ConnectionPool.
+
+    Blocking SQLite calls run on a dedicated executor sized to the pool, so
+    async handlers neither block the event loop nor occupy worker slots in
+    Starlette's shared threadpool while they wait on the database.
+    ``on_query``, if given, is called with ``(fn.__name__, seconds)`` for
+    every call.
+    """
+
+    def __init__(self, pool: ConnectionPool, on_query=None):
+        self.pool = pool
+        self.on_query = on_query
+        self._executor = None
+
+    def _call(self, fn, args):
+        with self.pool.connection() as conn:
+            if self.on_query is None:
+                return fn(conn, *args)
+            started = time.perf_counter()
+            try:
+                return fn(conn, *args)
+            finally:
+                self.on_query(fn.__name__, time.perf_counter() - started)
+
+    async def run(self, fn, *args):
+        """Run ``fn(conn, *args)`` on a pooled connection and return its result"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool.size, thread_name_prefix="db"
+            )
+        loop = asyncio.get_running_loop()
+        # Carry the caller's context variables (e.g. the request profile) into the thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, context.run, self._call, fn, args)
+
+    def close(self):
+        """Shut down the executor; it is recreated on the next call"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,117 @@
+"""
+In-process Bloom filter that lets repeat signups skip the write path
+"""
+import hashlib
+import math
+
+# Rows fetched per warm-up query
+WARM_BATCH_SIZE = 10000
+
+
+class DuplicateFilter:
+    """Bloom filter over canonical emails already on the waitlist.
+
+    ``might_contain`` answers "definitely new" (False) or "probably a
+    duplicate" (True). A False answer sends the signup to the writer as
+    usual, and INSERT OR IGNORE still catches addresses this process has not
+    seen, for example ones added by another worker. A True answer is
+    confirmed with one indexed read before the request is treated as a
+    duplicate, so false positives only cost that read.
+
+    All mutations happen on the event loop thread, which means no lock is
+    needed.
+    """
+
+    def __init__(self, capacity: int = 1000000, error_rate: float = 0.01):
+        self.error_rate = error_rate
+        self.ready = False
+        self._size(capacity)
+
+        # Stats
+        self.checks = 0
+        self.maybe_duplicates = 0
+        self.saved = 0
+        self.false_positives = 0
+
+    def _size(self, capacity: int):
+        self.capacity = max(1, capacity)
+        bits = -self.capacity * math.log(self.error_rate) / (math.log(2) ** 2)
+        self.num_bits = max(64, int(bits))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Double hashing: k positions derived from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def might_contain(self, key: str) -> bool:
+        """False means the key was definitely never added"""
+        if not self.ready:
+            return False
+        self.checks += 1
+        for pos in self._positions(key):
+            if not self._bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        self.maybe_duplicates += 1
+        return True
+
+    def record(self, duplicate: bool):
+        """Record whether a "probably duplicate" answer was confirmed"""
+        if duplicate:
+            self.saved += 1
+        else:
+            self.false_positives += 1
+
+    async def warm(self, db):
+        """Load every stored canonical email, sizing the filter for the table.
+
+        Rows are read in keyset-paginated batches on the database executor
+        and added on the event loop. Signups that commit while this runs are
+        added by the signup handler, so none are missed.
+        """
+        total = await db.run(_count_rows)
+        if total * 2 > self.capacity:
+            self._size(total * 2)
+        last_id = 0
+        while True:
+            rows = await db.run(_fetch_canonical_batch, last_id, WARM_BATCH_SIZE)
+            for _, canonical in rows:
+                if canonical:
+                    self.add(canonical)
+            if len(rows) < WARM_BATCH_SIZE:
+                break
+            last_id = rows[-1][0]
+        self.ready = True
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "entries": self.count,
+            "capacity": self.capacity,
+            "bytes": len(self._bits),
+            "hashes": self.num_hashes,
+            "checks": self.checks,
+            "maybe_duplicates": self.maybe_duplicates,
+            "saved": self.saved,
+            "false_positives": self.false_positives,
+        }
+
+
+def _count_rows(conn) -> int:
+    return conn.execute("SELECT COUNT(*) FROM waitlist").fetchone()[0]
+
+
+def _fetch_canonical_batch(conn, after_id: int, limit: int):
+    return conn.execute(
+        "SELECT id, email_canonical FROM waitlist WHERE id > ? ORDER BY id LIMIT ?",
+        (after_id, limit)
+    ).fetchall()
@@ -0,0 +1,83 @@
+"""
+Streaming waitlist exports
+"""
+import csv
+import io
+import json
+import zlib
+
+from database import ConnectionPool
+
+# Rows fetched from SQLite per round trip while streaming
+EXPORT_BATCH_SIZE = 1000
+
+CSV_HEADER = ("Email", "Website", "Joined")
+
+
+def iter_export_batches(pool: ConnectionPool, since: str = None, batch_size: int = EXPORT_BATCH_SIZE):
+    """Yield lists of (email, website, created_at) rows, oldest first.
+
+    Rows are read in keyset-paginated batches on ``(created_at, id)``. A
+    pooled connection is checked out for each batch and returned before the
+    batch is yielded. A slow download therefore never pins a connection or
+    holds a read transaction open, which would stall WAL checkpoints.
+    """
+    where = []
+    params = []
+    if since:
+        where.append("created_at >= ?")
+        params.append(since)
+    position = None
+
+    while True:
+        clauses = list(where)
+        batch_params = list(params)
+        if position is not None:
+            clauses.append("(created_at, id) > (?, ?)")
+            batch_params.extend(position)
+        sql = "SELECT email, website, created_at, id FROM waitlist"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at, id LIMIT ?"
+        batch_params.append(batch_size)
+
+        with pool.connection() as conn:
+            rows = conn.execute(sql, batch_params).fetchall()
+        if not rows:
+            break
+        position = (rows[-1][2], rows[-1][3])
+        yield [row[:3] for row in rows]
+        if len(rows) < batch_size:
+            break
+
+
+def csv_chunks(batches):
+    """Encode row batches as CSV, one chunk per batch"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    yield buffer.getvalue().encode()
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows((email, website or "", created_at) for email, website, created_at in rows)
+        yield buffer.getvalue().encode()
+
+
+def ndjson_chunks(batches):
+    """Encode row batches as newline-delimited JSON, one chunk per batch"""
+    for rows in batches:
+        yield "".join(
+            json.dumps({"email": email, "website": website or "", "created_at": created_at}) + "\n"
+            for email, website, created_at in rows
+        ).encode()
+
+
+def gzip_chunks(chunks):
+    """Gzip-compress a stream of byte chunks incrementally"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -1,24 +1,53 @@
-from fastapi import FastAPI, HTTPException, Depends, Form
+import time
+# Recorded first so per-worker startup reports include import time
+IMPORT_STARTED_AT = time.time()
+
+from fastapi import FastAPI, HTTPException, Depends, Form, Query
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from starlette.middleware.sessions import SessionMiddleware
 from starlette.requests import Request
 from pydantic import BaseModel
-import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
+import base64
+import json
 import os
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
+import asyncio
 import logging
 import secrets
 from dotenv import load_dotenv
+from database import AsyncDatabase, ConnectionPool, PoolTimeout
+from signup_writer import SignupWriter
+from export import iter_export_batches, csv_chunks, ndjson_chunks, gzip_chunks
+from dashboard import DashboardCache, render_dashboard
+from cache import TTLCache, etag_matches
+from analytics import (
+    GRANULARITIES, MAX_BUCKETS, fetch_analytics, floor_time, rebuild_rollups, rollup_totals
+)
+from backup import BackupInProgress, BackupManager
+from broadcast import StatsBroadcaster
+from static_assets import StaticAssets, accepted_encodings
+from security import PublicPathSessionMiddleware, add_security_middleware
+from duplicate_filter import DuplicateFilter
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, Registry
+from profiling import (
+    ProfileBoundary, Profiler, ProfilingMiddleware,
+    phase as profile_phase, profiled, record as record_phase
+)
+from validation import InvalidEmail, canonical_email, normalize_website, validate_email, website_domain
+from bulk_import import (
+    IMPORT_CHUNK_SIZE, INSERTED, DUPLICATE, INVALID,
+    RecordParser, aiter_lines, insert_chunk, result_chunks
+)
 
 # Load environment variables
 load_dotenv()
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+import rate_limit_storage  # noqa: F401 - registers the sqlite:// limiter storage
 
 # Configure logging
 logging.basicConfig(
@@ -27,22 +56,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Rate limiting
-limiter = Limiter(key_func=get_remote_address)
-app = FastAPI(title="Content Union Waitlist API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database and start background jobs for the lifetime of the app"""
+    # The production launcher (server.py) runs schema setup once before forking workers
+    if os.getenv("WAITLIST_SCHEMA_READY") != "1":
+        init_db()
+    await signup_writer.start()
+    await stats_broadcaster.start()
+    reconcile_task = asyncio.create_task(reconcile_signup_counter_periodically())
+    warm_task = asyncio.create_task(warm_duplicate_filter())
+    backup_task = asyncio.create_task(backup_periodically()) if BACKUP_INTERVAL > 0 else None
+    launched_at = float(os.getenv("WAITLIST_LAUNCHED_AT", IMPORT_STARTED_AT))
+    logger.info(
+        f"Worker {os.getpid()} ready in {time.time() - launched_at:.2f}s "
+        f"(app import {IMPORT_FINISHED_AT - IMPORT_STARTED_AT:.2f}s)"
+    )
+    try:
+        yield
+    finally:
+        reconcile_task.cancel()
+        warm_task.cancel()
+        if backup_task is not None:
+            backup_task.cancel()
+        await backups.stop()
+        await stats_broadcaster.stop()
+        await signup_writer.stop()
+        db.close()
+        db_pool.close()
+
+# Rate limiting. Use a shared storage such as sqlite:///ratelimits.db when
+# running several workers so limits hold across processes.
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+# RATE_LIMIT_ENABLED=0 turns limits off, e.g. for load tests
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    enabled=os.getenv("RATE_LIMIT_ENABLED", "1") != "0"
+)
+app = FastAPI(title="Content Union Waitlist API", lifespan=lifespan)
+
+# Per-process Prometheus metrics, served at /metrics
+metrics = Registry(prefix="waitlist_")
+http_requests = metrics.counter(
+    "http_requests", "HTTP requests by method, route and status", ("method", "route", "status")
+)
+http_latency = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route", ("method", "route")
+)
+db_query_seconds = metrics.histogram(
+    "db_query_duration_seconds", "Time spent running database work, by operation", ("operation",)
+)
+db_checkout_seconds = metrics.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting to check out a pooled connection"
+)
+rate_limit_rejections = metrics.counter(
+    "rate_limit_rejections", "Requests rejected by the rate limiter", ("route",)
+)
+signup_results = metrics.counter(
+    "signups", "Signup attempts by source (api, import) and result", ("source", "result")
+)
+# Optional bearer token required to scrape /metrics
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Sampled per-request phase timings, served at /admin/profile (0 disables sampling)
+profiler = Profiler(sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")))
+
+def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    """slowapi's 429 response, counted per route"""
+    rate_limit_rejections.inc(request.url.path)
+    return _rate_limit_exceeded_handler(request, exc)
+
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
-# Mount static files (frontend build)
-if os.path.exists("../frontend/dist"):
-    app.mount("/assets", StaticFiles(directory="../frontend/dist/assets"), name="assets")
-    app.mount("/static", StaticFiles(directory="../frontend/dist"), name="static")
+# Static files (frontend build), indexed once at startup
+FRONTEND_DIST = os.getenv("FRONTEND_DIST", "../frontend/dist")
+static_assets = StaticAssets(FRONTEND_DIST)
 
-# Add session middleware
-app.add_middleware(SessionMiddleware, secret_key="your-secret-key-change-in-production")
+# Add session middleware. Public /api/* routes skip cookie decoding; /api/waitlist is admin-only.
+app.add_middleware(ProfileBoundary, name="session")
+app.add_middleware(
+    PublicPathSessionMiddleware,
+    secret_key="your-secret-key-change-in-production",
+    session_paths=("/api/waitlist",)
+)
 
 # CORS middleware for React frontend
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173,http://localhost:5174,http://localhost:5175,https://worldwebinterface-frontend.onrender.com").split(",")
+app.add_middleware(ProfileBoundary, name="cors")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
@@ -51,8 +153,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Security headers, added to every response including streamed ones
+app.add_middleware(ProfileBoundary, name="security_headers")
+add_security_middleware(app)
+
+# Latency covers every other middleware; only the sampling profiler sits outside
+app.add_middleware(ProfileBoundary, name="metrics")
+app.add_middleware(MetricsMiddleware, requests=http_requests, latency=http_latency)
+app.add_middleware(ProfilingMiddleware, profiler=profiler)
+
 # Database setup
 DATABASE_PATH = os.getenv("DATABASE_PATH", "waitlist.db")
+# Seconds between checks of the maintained signup counter against COUNT(*)
+COUNTER_RECONCILE_INTERVAL = int(os.getenv("COUNTER_RECONCILE_INTERVAL", "3600"))
+# Seconds a cached /api/stats response may be served (and cached by browsers/CDNs)
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "5"))
+
+def observe_db_checkout(seconds: float):
+    db_checkout_seconds.observe(seconds)
+    record_phase("db.checkout", seconds)
+
+def observe_db_query(operation: str, seconds: float):
+    db_query_seconds.observe(seconds, operation)
+    record_phase(f"db.{operation}", seconds)
+    if operation == "signup_batch":
+        backups.observe_write(seconds)
+
+# Connection pool shared by all requests
+db_pool = ConnectionPool(
+    DATABASE_PATH,
+    size=int(os.getenv("DB_POOL_SIZE", "5")),
+    busy_timeout_ms=int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000")),
+    checkout_timeout=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+    statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "128")),
+    on_checkout=observe_db_checkout,
+)
+
+# Async reads run on a dedicated executor; all writes go through one writer task
+db = AsyncDatabase(db_pool, on_query=observe_db_query)
+signup_writer = SignupWriter(
+    db_pool,
+    max_batch=int(os.getenv("SIGNUP_WRITER_MAX_BATCH", "256")),
+    on_query=observe_db_query,
+)
+# Repeat signups are answered from a read probe instead of queueing a write
+duplicate_filter = DuplicateFilter(
+    capacity=int(os.getenv("DUPLICATE_FILTER_CAPACITY", "1000000")),
+    error_rate=float(os.getenv("DUPLICATE_FILTER_ERROR_RATE", "0.01"))
+)
+
+# Online backups into rotated gzip snapshots (see backup.py). Point BACKUP_DIR
+# at another disk or volume to survive losing the database disk.
+BACKUP_DIR = os.getenv("BACKUP_DIR", os.path.join(os.path.dirname(DATABASE_PATH) or ".", "backups"))
+# Seconds between scheduled backups (0 = only on demand via POST /admin/backup)
+BACKUP_INTERVAL = int(os.getenv("BACKUP_INTERVAL", "0"))
+backups = BackupManager(
+    DATABASE_PATH,
+    BACKUP_DIR,
+    pages=int(os.getenv("BACKUP_PAGES_PER_STEP", "256")),
+    step_sleep=float(os.getenv("BACKUP_STEP_SLEEP_MS", "10")) / 1000,
+    keep=int(os.getenv("BACKUP_KEEP", "7")),
+)
+
+metrics.callback(
+    "db_pool_connections", "Pooled connections by state",
+    lambda: {("in_use",): db_pool.stats()["in_use_connections"], ("idle",): db_pool.stats()["idle_connections"]},
+    labelnames=("state",)
+)
+metrics.callback(
+    "signup_writer_queue_depth", "Writes waiting for the signup writer",
+    lambda: signup_writer.stats()["queued"]
+)
+metrics.callback(
+    "duplicate_filter_saved_writes", "Duplicate signups answered without a write transaction",
+    lambda: duplicate_filter.saved, kind="counter"
+)
+metrics.callback(
+    "backup_last_success_timestamp_seconds", "Unix time of the newest backup snapshot",
+    backups.newest_snapshot_at
+)
+metrics.callback(
+    "stats_stream_clients", "Open /api/stats/stream connections",
+    lambda: stats_broadcaster.clients
+)
 
 # Admin authentication
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
@@ -74,32 +257,363 @@ def verify_admin_credentials(username: str, password: str) -> bool:
     correct_password = secrets.compare_digest(password, ADMIN_PASSWORD)
     return correct_username and correct_password
 
+def database_error(e: Exception) -> HTTPException:
+    """503 when the connection pool is exhausted (retryable), otherwise a 500"""
+    if isinstance(e, PoolTimeout):
+        logger.error(f"Database pool exhausted: {str(e)}")
+        return HTTPException(status_code=503, detail="Service busy, please retry")
+    return HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    """Context manager for pooled database connections"""
     try:
-        yield conn
-    finally:
-        conn.close()
+        with db_pool.connection() as conn:
+            yield conn
+    except PoolTimeout as e:
+        raise database_error(e)
 
 def init_db():
     """Initialize SQLite database with waitlist table"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS waitlist (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                email TEXT UNIQUE NOT NULL,
+                website TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # Single-row signup counters kept up to date by triggers, so reads are O(1).
+        # version changes on every write and keys caches of rendered data.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS waitlist_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_signups INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        stats_columns = {row[1] for row in cursor.execute("PRAGMA table_info(waitlist_stats)")}
+        if "with_website" not in stats_columns:
+            cursor.execute(
+                "ALTER TABLE waitlist_stats ADD COLUMN with_website INTEGER NOT NULL DEFAULT 0"
+            )
+            cursor.execute(
+                "UPDATE waitlist_stats SET with_website = "
+                "(SELECT COUNT(*) FROM waitlist WHERE website IS NOT NULL AND website != '')"
+            )
+        if "version" not in stats_columns:
+            cursor.execute("ALTER TABLE waitlist_stats ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        # Recreate the triggers so their bodies track the columns above
+        cursor.execute("DROP TRIGGER IF EXISTS waitlist_stats_after_insert")
+        cursor.execute("DROP TRIGGER IF EXISTS waitlist_stats_after_delete")
+        cursor.execute("""
+            CREATE TRIGGER waitlist_stats_after_insert
+            AFTER INSERT ON waitlist
+            BEGIN
+                UPDATE waitlist_stats SET
+                    total_signups = total_signups + 1,
+                    with_website = with_website + (COALESCE(NEW.website, '') != ''),
+                    version = version + 1
+                WHERE id = 1;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER waitlist_stats_after_delete
+            AFTER DELETE ON waitlist
+            BEGIN
+                UPDATE waitlist_stats SET
+                    total_signups = total_signups - 1,
+                    with_website = with_website - (COALESCE(OLD.website, '') != ''),
+                    version = version + 1
+                WHERE id = 1;
+            END
+        """)
+        # Seed the counters from the real counts the first time the table exists
+        cursor.execute("""
+            INSERT OR IGNORE INTO waitlist_stats (id, total_signups, with_website)
+            SELECT 1, COUNT(*), COUNT(NULLIF(website, '')) FROM waitlist
+        """)
+        # Normalized website host, used for domain filters
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(waitlist)")}
+        if "website_domain" not in columns:
+            cursor.execute("ALTER TABLE waitlist ADD COLUMN website_domain TEXT")
+            rows = cursor.execute(
+                "SELECT id, website FROM waitlist WHERE website IS NOT NULL AND website != ''"
+            ).fetchall()
+            cursor.executemany(
+                "UPDATE waitlist SET website_domain = ? WHERE id = ?",
+                [(website_domain(website), row_id) for row_id, website in rows]
+            )
+        # Canonical mailbox (no +tags, no Gmail dots) so near-duplicates are one index probe
+        if "email_canonical" not in columns:
+            cursor.execute("ALTER TABLE waitlist ADD COLUMN email_canonical TEXT")
+            seen = set()
+            updates = []
+            collisions = 0
+            for row_id, email in cursor.execute("SELECT id, email FROM waitlist ORDER BY id").fetchall():
+                canonical = canonical_email(email.strip().lower())
+                if canonical in seen:
+                    # Keep the earliest signup as the owner; later ones stay NULL
+                    collisions += 1
+                    continue
+                seen.add(canonical)
+                updates.append((canonical, row_id))
+            cursor.executemany("UPDATE waitlist SET email_canonical = ? WHERE id = ?", updates)
+            if collisions:
+                logger.warning(f"{collisions} existing signups share a canonical email with an earlier one")
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_waitlist_email_canonical ON waitlist (email_canonical)"
+        )
+        # Analytics rollups: signups per hour and per website domain
+        rollups_exist = cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' "
+            "AND name IN ('signups_hourly', 'signups_by_domain')"
+        ).fetchone()[0] == 2
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS signups_hourly (
+                hour TEXT PRIMARY KEY,
+                signups INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS signups_by_domain (
+                domain TEXT PRIMARY KEY,
+                signups INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_signups_by_domain_signups ON signups_by_domain (signups)"
+        )
+        # Inserts add to the rollups once per batch (analytics.add_to_rollups) rather
+        # than per row; deletes are rare, so a trigger handles them
+        cursor.execute("DROP TRIGGER IF EXISTS waitlist_rollups_after_insert")
+        cursor.execute("DROP TRIGGER IF EXISTS waitlist_rollups_after_delete")
+        cursor.execute("""
+            CREATE TRIGGER waitlist_rollups_after_delete
+            AFTER DELETE ON waitlist
+            BEGIN
+                UPDATE signups_hourly SET signups = signups - 1
+                WHERE hour = strftime('%Y-%m-%d %H:00:00', OLD.created_at);
+                DELETE FROM signups_hourly
+                WHERE hour = strftime('%Y-%m-%d %H:00:00', OLD.created_at) AND signups <= 0;
+                UPDATE signups_by_domain SET signups = signups - 1 WHERE domain = OLD.website_domain;
+                DELETE FROM signups_by_domain WHERE domain = OLD.website_domain AND signups <= 0;
+            END
+        """)
+        if not rollups_exist:
+            rebuild_rollups(cursor)
+        # Indexes backing keyset pagination, newest first
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_waitlist_created_at_id ON waitlist (created_at, id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_waitlist_domain_created_at_id "
+            "ON waitlist (website_domain, created_at, id)"
+        )
+        conn.commit()
+
+def get_total_signups(conn) -> int:
+    """Read the maintained signup counter"""
+    row = conn.execute("SELECT total_signups FROM waitlist_stats WHERE id = 1").fetchone()
+    return row[0] if row else 0
+
+def get_waitlist_stats(conn) -> tuple:
+    """Maintained (total_signups, with_website, version) counters"""
+    row = conn.execute(
+        "SELECT total_signups, with_website, version FROM waitlist_stats WHERE id = 1"
+    ).fetchone()
+    return row if row else (0, 0, 0)
+
+# Rendered dashboard pages, dropped whenever waitlist_stats.version changes
+dashboard_cache = DashboardCache()
+
+# Serialized /api/stats response, invalidated on every successful signup
+stats_cache = TTLCache(ttl=STATS_CACHE_TTL)
+
+# Live counter for /api/stats/stream, shared by every connected client of this worker
+stats_broadcaster = StatsBroadcaster(
+    lambda: db.run(get_total_signups),
+    max_updates_per_second=float(os.getenv("STATS_STREAM_MAX_UPDATES_PER_SECOND", "2")),
+    poll_interval=float(os.getenv("STATS_STREAM_POLL_INTERVAL", "5")),
+    keepalive=float(os.getenv("STATS_STREAM_KEEPALIVE", "15")),
+    max_clients=int(os.getenv("STATS_STREAM_MAX_CLIENTS", "5000")),
+)
+
+# Page size bounds for /api/waitlist
+WAITLIST_PAGE_DEFAULT = 50
+WAITLIST_PAGE_MAX = 500
+
+def encode_cursor(sort_key: str, row_id: int) -> str:
+    """Opaque keyset cursor for the row a page ended on (created_at, or email for prefix searches)"""
+    raw = json.dumps([sort_key, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    """Inverse of encode_cursor; raises ValueError on malformed input"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_key, row_id = json.loads(raw)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(sort_key, str) or not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    return sort_key, row_id
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Drop the timezone after converting to UTC, matching stored timestamps"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def format_db_timestamp(value: datetime) -> str:
+    """Format a datetime like SQLite's CURRENT_TIMESTAMP (UTC, second precision)"""
+    return to_utc_naive(value).strftime("%Y-%m-%d %H:%M:%S")
+
+def fetch_waitlist_page(
+    conn,
+    limit: int,
+    cursor: Optional[tuple] = None,
+    email_prefix: Optional[str] = None,
+    domain: Optional[str] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+):
+    """One page of waitlist rows, using keyset pagination.
+
+    Rows come newest first on (created_at, id). With ``email_prefix`` they
+    come in email order on (email, id) instead, so the page is read straight
+    off the email index. Sorting every match by date would cost time in
+    proportion to the matches, however short the page.
+    """
+    where = []
+    params = []
+    if email_prefix:
+        # Range scan instead of LIKE so the unique email index can be used
+        where.append("email >= ? AND email < ?")
+        params.extend([email_prefix, email_prefix[:-1] + chr(ord(email_prefix[-1]) + 1)])
+        if cursor is not None:
+            where.append("(email, id) > (?, ?)")
+            params.extend(cursor)
+    elif cursor is not None:
+        where.append("(created_at, id) < (?, ?)")
+        params.extend(cursor)
+    # Under a prefix search, unary + keeps the other filters off their indexes so
+    # the planner does not pick one of them and sort the matches by email
+    plain = "+" if email_prefix else ""
+    if domain:
+        where.append(f"{plain}website_domain = ?")
+        params.append(domain)
+    if created_after:
+        where.append(f"{plain}created_at >= ?")
+        params.append(created_after)
+    if created_before:
+        where.append(f"{plain}created_at < ?")
+        params.append(created_before)
+
+    sql = "SELECT id, email, website, created_at FROM waitlist"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if email_prefix:
+        sql += " ORDER BY email, id LIMIT ?"
+    else:
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+    params.append(limit + 1)
+
+    rows = conn.execute(sql, params).fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[1] if email_prefix else last[3], last[0])
+    return rows, next_cursor
+
+def reconcile_signup_counter(conn) -> dict:
+    """Check the maintained signup counter against the real row count and repair drift"""
     cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS waitlist (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT UNIQUE NOT NULL,
-            website TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    # Hold the write lock so no signup lands between the count and the repair
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute(
+            "SELECT COUNT(*), COUNT(NULLIF(website, '')), COUNT(website_domain) FROM waitlist"
         )
-    """)
-    conn.commit()
-    conn.close()
+        actual, actual_with_website, actual_with_domain = cursor.fetchone()
+        stored, stored_with_website, _ = get_waitlist_stats(cursor)
+        repaired = (stored, stored_with_website) != (actual, actual_with_website)
+        if repaired:
+            cursor.execute(
+                "UPDATE waitlist_stats SET total_signups = ?, with_website = ?, "
+                "version = version + 1 WHERE id = 1",
+                (actual, actual_with_website)
+            )
+            logger.warning(
+                f"Signup counter drift repaired: stored={stored}/{stored_with_website} "
+                f"actual={actual}/{actual_with_website}"
+            )
+        # Compact the analytics rollups too if they disagree with the table
+        rollup_signups, rollup_with_domain = rollup_totals(cursor)
+        rollups_repaired = (rollup_signups, rollup_with_domain) != (actual, actual_with_domain)
+        if rollups_repaired:
+            rebuild_rollups(cursor)
+            logger.warning(
+                f"Analytics rollup drift repaired: stored={rollup_signups}/{rollup_with_domain} "
+                f"actual={actual}/{actual_with_domain}"
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return {
+        "stored": stored,
+        "actual": actual,
+        "repaired": repaired,
+        "rollups_repaired": rollups_repaired,
+    }
+
+async def reconcile_signup_counter_periodically():
+    """Background job that reconciles the signup counter every COUNTER_RECONCILE_INTERVAL seconds"""
+    while True:
+        try:
+            await signup_writer.run(reconcile_signup_counter)
+        except Exception as e:
+            logger.error(f"Signup counter reconcile failed: {str(e)}")
+        await asyncio.sleep(COUNTER_RECONCILE_INTERVAL)
+
+async def backup_periodically():
+    """Background job that keeps a snapshot no older than BACKUP_INTERVAL seconds.
 
-# Initialize database on startup
-init_db()
+    Every worker runs this loop. The backup lock and the snapshot age check
+    mean only one of them backs up each interval.
+    """
+    while True:
+        await asyncio.sleep(min(BACKUP_INTERVAL, 300))
+        try:
+            await backups.run(max_age=BACKUP_INTERVAL)
+        except BackupInProgress:
+            pass
+        except Exception as e:
+            logger.error(f"Scheduled backup failed: {str(e)}")
+
+async def warm_duplicate_filter():
+    """Load existing signups into the duplicate filter without delaying startup"""
+    started = time.perf_counter()
+    try:
+        await duplicate_filter.warm(db)
+    except Exception as e:
+        logger.error(f"Duplicate filter warm-up failed: {str(e)}")
+        return
+    logger.info(
+        f"Duplicate filter warmed with {duplicate_filter.count} signups "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+
+def find_existing_signup(conn, email_canonical: str):
+    """``(exists, total_signups)`` from one indexed probe and the counter row"""
+    return conn.execute(
+        "SELECT EXISTS(SELECT 1 FROM waitlist WHERE email_canonical = ?), "
+        "(SELECT total_signups FROM waitlist_stats WHERE id = 1)",
+        (email_canonical,)
+    ).fetchone()
 
 class SignupRequest(BaseModel):
     email: str
@@ -116,98 +630,252 @@ def read_root():
     return {"message": "Content Union Waitlist API", "status": "running"}
 
 @app.get("/")
-def serve_frontend():
+def serve_frontend(request: Request):
     """Serve the React frontend"""
-    if os.path.exists("../frontend/dist/index.html"):
-        return FileResponse("../frontend/dist/index.html")
+    response = static_assets.index_response(
+        request.headers.get("accept-encoding", ""), request.headers.get("if-none-match")
+    )
+    if response is not None:
+        return response
     return {"message": "Frontend not built. Run 'npm run build' first."}
 
 
 @app.get("/api/stats")
 @limiter.limit("30/minute")
-def get_stats(request: Request):
+@profiled
+async def get_stats(request: Request):
     """Get current signup statistics"""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    cached = stats_cache.get("stats")
+    if cached is None:
         try:
-            cursor.execute("SELECT COUNT(*) FROM waitlist")
-            total_signups = cursor.fetchone()[0]
-            logger.info(f"Stats requested - Total signups: {total_signups}")
-            return {"total_signups": total_signups}
+            total_signups = await db.run(get_total_signups)
         except Exception as e:
             logger.error(f"Database error in get_stats: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+            raise database_error(e)
+        logger.debug(f"Stats refreshed - Total signups: {total_signups}")
+        body = json.dumps({"total_signups": total_signups}).encode()
+        cached = stats_cache.set("stats", (body, f'"stats-{total_signups}"'))
+    
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={STATS_CACHE_TTL}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/api/stats/stream")
+@limiter.limit("30/minute")
+async def stream_stats(request: Request):
+    """Server-Sent Events feed of the signup total, pushed as it changes"""
+    updates = stats_broadcaster.try_subscribe()
+    if updates is None:
+        raise HTTPException(status_code=503, detail="Too many live connections, poll /api/stats instead")
+    
+    async def events():
+        try:
+            # Reconnect after 5s if the connection drops
+            yield "retry: 5000\n\n"
+            async for update in updates:
+                if update is None:
+                    yield ": keepalive\n\n"
+                else:
+                    version, total = update
+                    yield f"id: {version}\ndata: {json.dumps({'total_signups': total})}\n\n"
+        finally:
+            await updates.aclose()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # X-Accel-Buffering stops nginx-style proxies from holding events back
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.post("/api/signup")
 @limiter.limit("5/minute")
-def signup(signup_data: SignupRequest, request: Request):
+@profiled
+async def signup(signup_data: SignupRequest, request: Request):
     """Add email to waitlist"""
     # Validate email format
-    email = signup_data.email.lower().strip()
-    if not email or '@' not in email or len(email) > 254:
-        logger.warning(f"Invalid email format attempted: {email[:20]}...")
-        raise HTTPException(status_code=400, detail="Invalid email format")
+    try:
+        email, canonical = validate_email(signup_data.email)
+    except InvalidEmail as e:
+        signup_results.inc("api", "invalid")
+        logger.warning(f"Invalid email attempted ({e}): {signup_data.email.strip()[:20]}...")
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Basic email validation
-    if not email.count('@') == 1 or '..' in email:
-        logger.warning(f"Invalid email format attempted: {email[:20]}...")
-        raise HTTPException(status_code=400, detail="Invalid email format")
+    try:
+        inserted = None
+        if duplicate_filter.might_contain(canonical):
+            # Probably a repeat: confirm with a read and skip the write queue
+            exists, total_signups = await db.run(find_existing_signup, canonical)
+            duplicate_filter.record(bool(exists))
+            if exists:
+                inserted = False
+        if inserted is None:
+            # Queue the insert; the writer group-commits concurrent signups
+            website, domain = normalize_website(signup_data.website)
+            with profile_phase("signup_writer"):
+                inserted, total_signups = await signup_writer.submit(email, website, domain, canonical)
+            duplicate_filter.add(canonical)
+    except Exception as e:
+        raise database_error(e)
     
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        try:
-            # Insert new signup
-            cursor.execute(
-                "INSERT INTO waitlist (email, website) VALUES (?, ?)",
-                (email, signup_data.website.strip()[:500])  # Limit website URL length
-            )
-            conn.commit()
-            
-            # Get updated count
-            cursor.execute("SELECT COUNT(*) FROM waitlist")
-            total_signups = cursor.fetchone()[0]
-            
-            logger.info(f"New signup: {email[:20]}... - Total: {total_signups}")
-            
-            return SignupResponse(
-                success=True,
-                message="Successfully joined the waitlist!",
-                total_signups=total_signups
-            )
-            
-        except sqlite3.IntegrityError:
-            # Email already exists
-            cursor.execute("SELECT COUNT(*) FROM waitlist")
-            total_signups = cursor.fetchone()[0]
-            
-            logger.info(f"Duplicate signup attempt: {email[:20]}...")
-            
-            return SignupResponse(
-                success=False,
-                message="Email already registered!",
-                total_signups=total_signups
-            )
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    if not inserted:
+        # Email already exists
+        signup_results.inc("api", "duplicate")
+        logger.info(f"Duplicate signup attempt: {email[:20]}...")
+        
+        return SignupResponse(
+            success=False,
+            message="Email already registered!",
+            total_signups=total_signups
+        )
+    
+    stats_cache.invalidate("stats")
+    stats_broadcaster.publish(total_signups)
+    signup_results.inc("api", "inserted")
+    logger.info(f"New signup: {email[:20]}... - Total: {total_signups}")
+    
+    return SignupResponse(
+        success=True,
+        message="Successfully joined the waitlist!",
+        total_signups=total_signups
+    )
 
 @app.get("/api/waitlist")
-def get_waitlist(authenticated: bool = Depends(verify_admin_session)):
-    """Get all waitlist entries (for admin use)"""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT email, website, created_at FROM waitlist ORDER BY created_at DESC")
-            entries = cursor.fetchall()
-            
-            return {
-                "entries": [
-                    {"email": entry[0], "website": entry[1], "created_at": entry[2]}
-                    for entry in entries
-                ]
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+@profiled
+async def get_waitlist(
+    authenticated: bool = Depends(verify_admin_session),
+    limit: int = Query(WAITLIST_PAGE_DEFAULT, ge=1, le=WAITLIST_PAGE_MAX),
+    cursor: Optional[str] = None,
+    email_prefix: Optional[str] = None,
+    domain: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+):
+    """Get a page of waitlist entries, newest first or by email with email_prefix (for admin use)"""
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        entries, next_cursor = await db.run(
+            fetch_waitlist_page,
+            limit,
+            position,
+            email_prefix.lower().strip() if email_prefix else None,
+            website_domain(domain) if domain else None,
+            format_db_timestamp(created_after) if created_after else None,
+            format_db_timestamp(created_before) if created_before else None,
+        )
+        
+        return {
+            "entries": [
+                {"email": entry[1], "website": entry[2], "created_at": entry[3]}
+                for entry in entries
+            ],
+            "next_cursor": next_cursor,
+            "limit": limit
+        }
+    except Exception as e:
+        raise database_error(e)
+
+@app.get("/admin/diagnostics")
+async def admin_diagnostics(authenticated: bool = Depends(verify_admin_session)):
+    """Internal runtime stats (for admin use)"""
+    return {
+        "db_pool": db_pool.stats(),
+        "signup_writer": signup_writer.stats(),
+        "stats_cache": stats_cache.stats(),
+        "stats_stream": stats_broadcaster.stats(),
+        "duplicate_filter": duplicate_filter.stats()
+    }
+
+def fetch_analytics_report(conn, *args) -> dict:
+    """Signup counters plus the rollup analytics, read on one connection"""
+    total_signups, with_website, _ = get_waitlist_stats(conn)
+    return {
+        "total_signups": total_signups,
+        "with_website": with_website,
+        **fetch_analytics(conn, *args),
+    }
+
+@app.get("/admin/analytics")
+@profiled
+async def admin_analytics(
+    authenticated: bool = Depends(verify_admin_session),
+    granularity: str = "day",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    top_domains: int = Query(10, ge=1, le=100),
+):
+    """Signups over time, top website domains and growth, from the rollup tables (for admin use)"""
+    if granularity not in GRANULARITIES:
+        raise HTTPException(
+            status_code=400, detail=f"granularity must be one of: {', '.join(GRANULARITIES)}"
+        )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    until = to_utc_naive(until) if until else now
+    # Default window: a week of hours or a quarter of days
+    since = to_utc_naive(since) if since else until - GRANULARITIES[granularity] * (
+        24 * 7 if granularity == "hour" else 90
+    )
+    # Series start on a bucket boundary, so count buckets from the floored start
+    since = floor_time(since, granularity)
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+    if (until - since) / GRANULARITIES[granularity] > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many {granularity} buckets requested (max {MAX_BUCKETS})"
+        )
+
+    try:
+        return await db.run(fetch_analytics_report, granularity, since, until, top_domains, now)
+    except Exception as e:
+        raise database_error(e)
+
+@app.post("/admin/backup", status_code=202)
+async def admin_backup(authenticated: bool = Depends(verify_admin_session)):
+    """Start an online backup in the background (for admin use)"""
+    try:
+        backups.start()
+    except BackupInProgress as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"started": True, "directory": BACKUP_DIR}
+
+@app.get("/admin/backup")
+def admin_backup_status(authenticated: bool = Depends(verify_admin_session)):
+    """Backup progress, the last result (with signup write latency during it) and snapshots (for admin use)"""
+    return backups.stats()
+
+@app.get("/metrics")
+def get_metrics(request: Request):
+    """Prometheus metrics for this worker process"""
+    if METRICS_TOKEN and not secrets.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/admin/profile")
+def admin_profile(reset: bool = False, authenticated: bool = Depends(verify_admin_session)):
+    """Aggregated request profiles sampled by this worker (for admin use)"""
+    report = profiler.report()
+    if reset:
+        profiler.reset()
+    return report
+
+@app.post("/admin/profile")
+def admin_profile_configure(
+    sample_rate: float = Query(..., ge=0, le=1),
+    authenticated: bool = Depends(verify_admin_session)
+):
+    """Change this worker's profiling sample rate (0 disables profiling)"""
+    profiler.sample_rate = sample_rate
+    logger.info(f"Profiling sample rate set to {sample_rate}")
+    return {"sample_rate": sample_rate}
 
 @app.get("/admin")
 def admin_panel(request: Request):
@@ -310,172 +978,175 @@ def admin_logout(request: Request):
     request.session.pop("admin_authenticated", None)
     return RedirectResponse(url="/admin/login", status_code=302)
 
+def fetch_dashboard_page(conn, limit: int, position: Optional[tuple]):
+    """Rows for one dashboard page plus the newest signup time"""
+    rows, next_cursor = fetch_waitlist_page(conn, limit, position)
+    latest_signup = conn.execute("SELECT MAX(created_at) FROM waitlist").fetchone()[0]
+    return rows, next_cursor, latest_signup
+
 @app.get("/admin/dashboard", response_class=HTMLResponse)
-def admin_dashboard(request: Request, authenticated: bool = Depends(verify_admin_session)):
+@profiled
+async def admin_dashboard(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(WAITLIST_PAGE_DEFAULT, ge=1, le=WAITLIST_PAGE_MAX),
+    start: int = Query(1, ge=1),
+    authenticated: bool = Depends(verify_admin_session)
+):
     """Beautiful HTML admin panel"""
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT email, website, created_at FROM waitlist ORDER BY created_at DESC")
-            entries = cursor.fetchall()
-            
-            # Generate table rows
-            table_rows = ""
-            for i, entry in enumerate(entries, 1):
-                email = entry[0]
-                website = entry[1] if entry[1] else "Not provided"
-                created_at = entry[2]
-                
-                table_rows += f"""
-                <tr class="border-b border-gray-200 hover:bg-gray-50">
-                    <td class="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">{i}</td>
-                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{email}</td>
-                    <td class="px-6 py-4 whitespace-nowrap text-sm text-blue-600">
-                        {f'<a href="{website}" target="_blank" class="hover:underline">{website}</a>' if website != "Not provided" else website}
-                    </td>
-                    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{created_at}</td>
-                </tr>
-                """
-            
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Website Union - Admin Panel</title>
-                <script src="https://cdn.tailwindcss.com"></script>
-                <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-            </head>
-            <body class="bg-gray-100 min-h-screen">
-                <div class="max-w-7xl mx-auto py-8 px-4 sm:px-6 lg:px-8">
-                    <!-- Header -->
-                    <div class="mb-8">
-                        <div class="flex items-center justify-between">
-                            <div>
-                                <h1 class="text-3xl font-bold text-gray-900">Admin Panel</h1>
-                                <p class="mt-2 text-gray-600">Website Union Waitlist Management</p>
-                            </div>
-                            <div class="flex space-x-4">
-                                <button onclick="exportCSV()" class="bg-green-500 hover:bg-green-600 text-white px-4 py-2 rounded-lg flex items-center space-x-2">
-                                    <i class="fas fa-download"></i>
-                                    <span>Export CSV</span>
-                                </button>
-                                <button onclick="window.location.reload()" class="bg-blue-500 hover:bg-blue-600 text-white px-4 py-2 rounded-lg flex items-center space-x-2">
-                                    <i class="fas fa-refresh"></i>
-                                    <span>Refresh</span>
-                                </button>
-                                <a href="/admin/logout" class="bg-red-500 hover:bg-red-600 text-white px-4 py-2 rounded-lg flex items-center space-x-2">
-                                    <i class="fas fa-sign-out-alt"></i>
-                                    <span>Logout</span>
-                                </a>
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Stats Cards -->
-                    <div class="grid grid-cols-1 md:grid-cols-3 gap-6 mb-8">
-                        <div class="bg-white rounded-lg shadow p-6">
-                            <div class="flex items-center">
-                                <div class="p-3 rounded-full bg-blue-100">
-                                    <i class="fas fa-users text-blue-600 text-xl"></i>
-                                </div>
-                                <div class="ml-4">
-                                    <p class="text-sm font-medium text-gray-600">Total Signups</p>
-                                    <p class="text-2xl font-bold text-gray-900">{len(entries)}</p>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <div class="bg-white rounded-lg shadow p-6">
-                            <div class="flex items-center">
-                                <div class="p-3 rounded-full bg-green-100">
-                                    <i class="fas fa-globe text-green-600 text-xl"></i>
-                                </div>
-                                <div class="ml-4">
-                                    <p class="text-sm font-medium text-gray-600">With Websites</p>
-                                    <p class="text-2xl font-bold text-gray-900">{len([e for e in entries if e[1]])}</p>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <div class="bg-white rounded-lg shadow p-6">
-                            <div class="flex items-center">
-                                <div class="p-3 rounded-full bg-purple-100">
-                                    <i class="fas fa-calendar text-purple-600 text-xl"></i>
-                                </div>
-                                <div class="ml-4">
-                                    <p class="text-sm font-medium text-gray-600">Latest Signup</p>
-                                    <p class="text-sm font-bold text-gray-900">{entries[0][2] if entries else "None"}</p>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Table -->
-                    <div class="bg-white shadow rounded-lg overflow-hidden">
-                        <div class="px-6 py-4 border-b border-gray-200">
-                            <h2 class="text-lg font-semibold text-gray-900">Waitlist Entries</h2>
-                        </div>
-                        
-                        <div class="overflow-x-auto">
-                            <table class="min-w-full divide-y divide-gray-200">
-                                <thead class="bg-gray-50">
-                                    <tr>
-                                        <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">#</th>
-                                        <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Email</th>
-                                        <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Website</th>
-                                        <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Joined</th>
-                                    </tr>
-                                </thead>
-                                <tbody class="bg-white divide-y divide-gray-200">
-                                    {table_rows if entries else '<tr><td colspan="4" class="px-6 py-4 text-center text-gray-500">No signups yet</td></tr>'}
-                                </tbody>
-                            </table>
-                        </div>
-                    </div>
-                </div>
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        total_signups, with_website, version = await db.run(get_waitlist_stats)
+        cache_key = (cursor, limit, start)
+        html_content = dashboard_cache.get(version, cache_key)
+        if html_content is None:
+            rows, next_cursor, latest_signup = await db.run(fetch_dashboard_page, limit, position)
+            with profile_phase("render"):
+                html_content = render_dashboard(
+                    total_signups, with_website, latest_signup, rows, start, limit, next_cursor
+                )
+            dashboard_cache.put(version, cache_key, html_content)
+    except Exception as e:
+        raise database_error(e)
+    
+    return HTMLResponse(html_content)
 
-                <script>
-                function exportCSV() {{
-                    const data = {[{"email": entry[0], "website": entry[1] or "", "created_at": entry[2]} for entry in entries]};
-                    
-                    let csv = 'Email,Website,Joined\\n';
-                    data.forEach(row => {{
-                        csv += `"${{row.email}}","${{row.website}}","${{row.created_at}}"\\n`;
-                    }});
-                    
-                    const blob = new Blob([csv], {{ type: 'text/csv' }});
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = 'waitlist-signups.csv';
-                    a.click();
-                    window.URL.revokeObjectURL(url);
-                }}
-                </script>
-            </body>
-            </html>
-            """
-            
-            return html_content
-            
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+def export_response(request: Request, chunks, media_type: str, filename: str) -> StreamingResponse:
+    """Stream an export, gzip-compressed when the client accepts it"""
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in accepted_encodings(request.headers.get("accept-encoding", "")):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+@app.get("/admin/export.csv")
+def export_csv(
+    request: Request,
+    since: Optional[datetime] = None,
+    authenticated: bool = Depends(verify_admin_session)
+):
+    """Stream all waitlist entries as CSV, optionally only those created at or after `since`"""
+    batches = iter_export_batches(db_pool, format_db_timestamp(since) if since else None)
+    return export_response(request, csv_chunks(batches), "text/csv", "waitlist-signups.csv")
+
+@app.get("/admin/export.ndjson")
+def export_ndjson(
+    request: Request,
+    since: Optional[datetime] = None,
+    authenticated: bool = Depends(verify_admin_session)
+):
+    """Stream all waitlist entries as NDJSON, optionally only those created at or after `since`"""
+    batches = iter_export_batches(db_pool, format_db_timestamp(since) if since else None)
+    return export_response(
+        request, ndjson_chunks(batches), "application/x-ndjson", "waitlist-signups.ndjson"
+    )
+
+@app.post("/admin/import")
+async def admin_import(
+    request: Request,
+    fmt: Optional[str] = Query(None, alias="format"),
+    results: str = "rows",
+    authenticated: bool = Depends(verify_admin_session)
+):
+    """Bulk-import a streamed CSV or NDJSON upload with per-row results.
+
+    Rows are validated like /api/signup and inserted in chunked transactions
+    on the signup writer. The response is NDJSON: a summary line followed by
+    one {"row", "status"} line per data row, or only the summary with
+    ?results=summary.
+    """
+    if fmt is None:
+        fmt = "ndjson" if "json" in request.headers.get("content-type", "") else "csv"
+    if fmt not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+    if results not in ("rows", "summary"):
+        raise HTTPException(status_code=400, detail="results must be rows or summary")
+    
+    started = time.perf_counter()
+    parser = RecordParser(fmt)
+    statuses = bytearray()
+    pending = []  # (row index, (email, website, website_domain, email_canonical))
+    
+    async def flush():
+        chunk_statuses = await signup_writer.run(insert_chunk, [row for _, row in pending])
+        for (index, row), status in zip(pending, chunk_statuses):
+            statuses[index] = status
+            duplicate_filter.add(row[3])
+        pending.clear()
+    
+    try:
+        async for line in aiter_lines(request.stream()):
+            if not line.strip():
+                continue
+            record = parser.parse(line)
+            if record is False:
+                continue
+            if not record:
+                statuses.append(INVALID)
+                continue
+            try:
+                email, canonical = validate_email(record[0])
+            except InvalidEmail:
+                statuses.append(INVALID)
+                continue
+            website, domain = normalize_website(record[1])
+            statuses.append(INSERTED)  # Final status is set when the chunk commits
+            pending.append((len(statuses) - 1, (email, website, domain, canonical)))
+            if len(pending) >= IMPORT_CHUNK_SIZE:
+                await flush()
+        if pending:
+            await flush()
+    except Exception as e:
+        logger.error(f"Bulk import failed after {len(statuses)} rows: {str(e)}")
+        raise database_error(e)
+    finally:
+        stats_cache.invalidate("stats")
+        stats_broadcaster.refresh()
+    
+    summary = {
+        "rows": len(statuses),
+        "inserted": statuses.count(INSERTED),
+        "duplicate": statuses.count(DUPLICATE),
+        "invalid": statuses.count(INVALID),
+        "seconds": round(time.perf_counter() - started, 3)
+    }
+    for result in ("inserted", "duplicate", "invalid"):
+        signup_results.inc("import", result, amount=summary[result])
+    logger.info(f"Bulk import: {summary}")
+    if results == "summary":
+        return {"summary": summary}
+    return StreamingResponse(result_chunks(summary, statuses), media_type="application/x-ndjson")
 
 # Catch-all route to serve React app for client-side routing (must be last)
 @app.get("/{full_path:path}")
-def serve_react_app(full_path: str):
+def serve_react_app(full_path: str, request: Request):
     """Serve React app for all non-API routes"""
-    # Serve static files directly
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if_none_match = request.headers.get("if-none-match")
+    
+    # Serve static files directly (/static/* is kept as an alias of the build root)
+    path = full_path[len("static/"):] if full_path.startswith("static/") else full_path
+    response = static_assets.file_response(path, accept_encoding, if_none_match)
+    if response is not None:
+        return response
     if full_path.startswith("assets/"):
-        return FileResponse(f"../frontend/dist/{full_path}")
+        raise HTTPException(status_code=404, detail="Not found")
     
     # For all other routes, serve the React app
-    if os.path.exists("../frontend/dist/index.html"):
-        return FileResponse("../frontend/dist/index.html")
+    response = static_assets.index_response(accept_encoding, if_none_match)
+    if response is not None:
+        return response
     return {"message": "Frontend not built. Run 'npm run build' first."}
 
+IMPORT_FINISHED_AT = time.time()
+
 if __name__ == "__main__":
     import uvicorn
     host = os.getenv("API_HOST", "0.0.0.0")
@@ -0,0 +1,210 @@
+"""
+Low-overhead Prometheus-style metrics: counters, histograms and the /metrics text format
+"""
+import bisect
+import math
+import threading
+import time
+
+# Seconds; tuned for a SQLite-backed API where most requests take well under 100ms
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Starlette appends "; charset=utf-8" to text/* media types
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}_total{_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values.
+
+    ``observe`` is a bisect and three increments under an uncontended lock.
+    Most observations come from the event loop thread. The database executor
+    threads add the rest.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        bounds = [_format_value(float(b)) for b in self.buckets] + ["+Inf"]
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                le = f'le="{bound}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+            label_str = _labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_str} {_format_value(series[-2])}"
+            yield f"{self.name}_count{label_str} {series[-1]}"
+
+
+class CallbackMetric:
+    """Gauge or counter read from a callable at scrape time.
+
+    The callable returns a number, or a dict mapping label-value tuples to
+    numbers.
+    """
+
+    def __init__(self, name: str, help: str, fn, kind: str = "gauge", labelnames=()):
+        self.name = name
+        self.help = help
+        self.fn = fn
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+
+    def samples(self):
+        name = f"{self.name}_total" if self.kind == "counter" else self.name
+        values = self.fn()
+        if not isinstance(values, dict):
+            values = {(): values}
+        for labels, value in sorted(values.items()):
+            yield f"{name}{_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Registry:
+    """Holds this process's metrics and renders them in Prometheus text format"""
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._metrics = []
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames=()) -> Counter:
+        return self._register(Counter(self.prefix + name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(self.prefix + name, help, labelnames, buckets))
+
+    def callback(self, name: str, help: str, fn, kind: str = "gauge", labelnames=()) -> CallbackMetric:
+        return self._register(CallbackMetric(self.prefix + name, help, fn, kind, labelnames))
+
+    def render(self) -> bytes:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return ("\n".join(lines) + "\n").encode()
+
+
+_route_paths = {}  # id(app) -> {endpoint: path template}
+
+
+def route_template(scope) -> str:
+    """Path template of the route that handled ``scope``, e.g. ``/api/signup``.
+
+    Only valid once the router has run, since it reads the matched endpoint
+    the router stores in the scope.
+    """
+    app = scope.get("app")
+    paths = _route_paths.get(id(app))
+    if paths is None:
+        paths = _route_paths[id(app)] = {
+            getattr(route, "endpoint", None): route.path
+            for route in getattr(app, "routes", [])
+            if hasattr(route, "path")
+        }
+    return paths.get(scope.get("endpoint"), "unmatched")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts and latency per route.
+
+    Requests are labelled with the matched route's path template (for
+    example ``/api/signup``), never the raw URL, which keeps label
+    cardinality bounded by the number of routes.
+    """
+
+    def __init__(self, app, requests: Counter, latency: Histogram):
+        self.app = app
+        self.requests = requests
+        self.latency = latency
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = route_template(scope)
+            self.latency.observe(time.perf_counter() - started, scope["method"], route)
+            self.requests.inc(scope["method"], route, str(status))
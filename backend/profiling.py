@@ -0,0 +1,244 @@
+"""
+Opt-in sampling profiler that breaks request time down by phase
+"""
+import bisect
+import functools
+import inspect
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from metrics import route_template
+
+# Profile of the request being sampled, or None when this request is not sampled
+_current = ContextVar("request_profile", default=None)
+
+
+class RequestProfile:
+    """Timings collected for one sampled request"""
+
+    __slots__ = ("layers", "phases", "endpoint")
+
+    def __init__(self):
+        self.layers = []    # (middleware name, seconds spent inside it), innermost first
+        self.phases = []    # (phase name, seconds) recorded by the app
+        self.endpoint = None
+
+    def breakdown(self, total: float) -> dict:
+        """Flat phase -> seconds map that adds up to ``total``.
+
+        Middleware layers get their own time (their time minus that of
+        everything inside them). ``endpoint`` is the handler's own code, and
+        ``framework`` is routing, request parsing and validation, and
+        response serialization.
+        """
+        result = {}
+        outer = total
+        for name, inside in reversed(self.layers):
+            result[f"middleware.{name}"] = outer - inside
+            outer = inside
+        named = 0.0
+        for name, seconds in self.phases:
+            result[name] = result.get(name, 0.0) + seconds
+            named += seconds
+        if self.endpoint is not None:
+            result["endpoint"] = max(0.0, self.endpoint - named)
+            result["framework"] = max(0.0, outer - self.endpoint)
+        else:
+            result["framework"] = max(0.0, outer - named)
+        return result
+
+
+def record(name: str, seconds: float):
+    """Add a timed phase to the current request's profile, if it is sampled"""
+    profile = _current.get()
+    if profile is not None:
+        profile.phases.append((name, seconds))
+
+
+@contextmanager
+def phase(name: str):
+    """Time a block as a named phase of the current sampled request"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.phases.append((name, time.perf_counter() - started))
+
+
+def profiled(fn):
+    """Decorate an endpoint so its own run time is separated from the framework's"""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            profile = _current.get()
+            if profile is None:
+                return await fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                profile.endpoint = time.perf_counter() - started
+    else:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profile = _current.get()
+            if profile is None:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profile.endpoint = time.perf_counter() - started
+    return wrapper
+
+
+def _percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class Profiler:
+    """Aggregates sampled request profiles per route.
+
+    ``sample_rate`` can be changed at runtime. At 0 the middleware costs one
+    attribute check per request, and the markers cost one ContextVar lookup.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, max_samples: int = 1000, keep_slowest: int = 10):
+        self.sample_rate = sample_rate
+        self.max_samples = max_samples
+        self.keep_slowest = keep_slowest
+        self.reset()
+
+    def reset(self):
+        self._routes = {}
+        self._slowest = []  # sorted ascending by total seconds
+        self.started_at = time.time()
+        self.sampled = 0
+
+    def add(self, route: str, status: int, total: float, breakdown: dict):
+        self.sampled += 1
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = {
+                "count": 0, "seconds": 0.0, "totals": deque(maxlen=self.max_samples), "phases": {}
+            }
+        stats["count"] += 1
+        stats["seconds"] += total
+        stats["totals"].append(total)
+        for name, seconds in breakdown.items():
+            acc = stats["phases"].setdefault(name, [0.0, 0.0])
+            acc[0] += seconds
+            acc[1] = max(acc[1], seconds)
+
+        if len(self._slowest) < self.keep_slowest or total > self._slowest[0][0]:
+            sample = {
+                "route": route,
+                "status": status,
+                "at": round(time.time(), 3),
+                "total_ms": round(total * 1000, 3),
+                "phases_ms": {name: round(s * 1000, 3) for name, s in breakdown.items()},
+            }
+            bisect.insort(self._slowest, (total, id(sample), sample))
+            if len(self._slowest) > self.keep_slowest:
+                self._slowest.pop(0)
+
+    def report(self) -> dict:
+        routes = {}
+        for route, stats in self._routes.items():
+            # Percentiles cover the most recent max_samples; means cover every sample
+            totals = sorted(stats["totals"])
+            count = stats["count"]
+            phases = {}
+            for name, (seconds, peak) in sorted(
+                stats["phases"].items(), key=lambda item: -item[1][0]
+            ):
+                phases[name] = {
+                    "mean_ms": round(seconds / count * 1000, 3),
+                    "max_ms": round(peak * 1000, 3),
+                    "share": round(seconds / stats["seconds"], 3) if stats["seconds"] else 0.0,
+                }
+            routes[route] = {
+                "samples": count,
+                "total_ms": {
+                    "mean": round(stats["seconds"] / count * 1000, 3),
+                    "p50": round(_percentile(totals, 0.50) * 1000, 3),
+                    "p95": round(_percentile(totals, 0.95) * 1000, 3),
+                    "p99": round(_percentile(totals, 0.99) * 1000, 3),
+                    "max": round(totals[-1] * 1000, 3) if totals else 0.0,
+                },
+                "phases": phases,
+            }
+        return {
+            "sample_rate": self.sample_rate,
+            "since": round(self.started_at, 3),
+            "sampled_requests": self.sampled,
+            "routes": routes,
+            "slowest": [sample for _, _, sample in reversed(self._slowest)],
+        }
+
+
+class ProfilingMiddleware:
+    """Outermost ASGI middleware that samples requests into a Profiler"""
+
+    def __init__(self, app, profiler: Profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        rate = self.profiler.sample_rate
+        if not rate or scope["type"] != "http" or random.random() >= rate:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current.set(profile)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            total = time.perf_counter() - started
+            _current.reset(token)
+            route = f"{scope['method']} {route_template(scope)}"
+            self.profiler.add(route, status, total, profile.breakdown(total))
+
+
+class ProfileBoundary:
+    """Marker placed just inside a middleware to measure the time spent below it.
+
+    Add it immediately before the middleware it belongs to:
+
+        app.add_middleware(ProfileBoundary, name="session")
+        app.add_middleware(SessionMiddleware, ...)
+    """
+
+    def __init__(self, app, name: str):
+        self.app = app
+        self.name = name
+
+    async def __call__(self, scope, receive, send):
+        profile = _current.get()
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profile.layers.append((self.name, time.perf_counter() - started))
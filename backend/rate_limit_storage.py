@@ -0,0 +1,130 @@
+"""
+SQLite-backed rate limit storage shared by all worker processes
+
+Importing this module registers the ``sqlite://`` scheme with the ``limits``
+package, so it can be selected through slowapi's ``storage_uri``:
+
+    Limiter(key_func=..., storage_uri="sqlite:///ratelimits.db")
+
+Counters live in one small WAL-mode database file. Every uvicorn worker or
+replica on the same host therefore enforces the same limits, without running
+Redis or memcached.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from limits.storage import Storage
+
+# Expired counters are purged once every this many increments
+PURGE_EVERY = 1000
+
+
+def sqlite_path_from_uri(uri: str) -> str:
+    """``sqlite:///relative.db`` -> ``relative.db``; ``sqlite:////abs.db`` -> ``/abs.db``"""
+    path = uri.split("://", 1)[1] if "://" in uri else uri
+    if path.startswith("/"):
+        path = path[1:]
+    return path or "ratelimits.db"
+
+
+class SQLiteStorage(Storage):
+    """Fixed-window counters in SQLite, safe across threads and processes.
+
+    Each increment is one short ``BEGIN IMMEDIATE`` transaction (an upsert
+    and a read), so concurrent workers serialize on the SQLite write lock
+    rather than keeping separate in-memory counts.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str = "sqlite:///ratelimits.db", wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = sqlite_path_from_uri(uri)
+        self.busy_timeout_ms = int(options.get("busy_timeout_ms", 5000))
+        self._local = threading.local()
+        self._ops = 0
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                count INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        """One autocommit connection per thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Losing the last few counter updates on power loss is acceptable
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+            self._local.conn = conn
+        return conn
+
+    def incr(self, key: str, expiry: int, elastic_expiry: bool = False, amount: int = 1) -> int:
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """
+                INSERT INTO rate_limits (key, count, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    count = CASE WHEN expires_at <= ? THEN excluded.count
+                                 ELSE count + excluded.count END,
+                    expires_at = CASE WHEN expires_at <= ? OR ? THEN excluded.expires_at
+                                      ELSE expires_at END
+                """,
+                (key, amount, now + expiry, now, now, bool(elastic_expiry))
+            )
+            count = conn.execute("SELECT count FROM rate_limits WHERE key = ?", (key,)).fetchone()[0]
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._ops += 1
+        if self._ops % PURGE_EVERY == 0:
+            self._purge(now)
+        return count
+
+    def _purge(self, now: float):
+        self._connection().execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+
+    def get(self, key: str) -> int:
+        row = self._connection().execute(
+            "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        row = self._connection().execute(
+            "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else time.time()
+
+    def check(self) -> bool:
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int:
+        return self._connection().execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        self._connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
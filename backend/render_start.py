@@ -3,8 +3,9 @@
 Render-specific startup script
 """
 import os
-import uvicorn
+
+from server import run
 
 if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 10000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, log_level="info", reload=False)
+    os.environ.setdefault("PORT", "10000")
+    run()
@@ -1,29 +1,114 @@
 """
 Security middleware and utilities for production deployment
 """
-from fastapi import FastAPI, Request, Response
-from fastapi.middleware.base import BaseHTTPMiddleware
-import time
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses"""
-    
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-        
+from fastapi import FastAPI
+from starlette.middleware.sessions import SessionMiddleware
+
+# The admin pages load Tailwind's play CDN (which injects <style> tags) and
+# Font Awesome from cdnjs, and use small inline scripts and handlers.
+DEFAULT_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' https://cdn.tailwindcss.com; "
+    "style-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
+    "font-src 'self' data: https://cdnjs.cloudflare.com; "
+    "img-src 'self' data:; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+# FastAPI's /docs (Swagger UI) and /redoc load their bundles from jsDelivr,
+# ReDoc adds Google Fonts and a blob: web worker, and both use the FastAPI favicon.
+DOCS_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://fonts.googleapis.com; "
+    "font-src 'self' data: https://fonts.gstatic.com; "
+    "img-src 'self' data: https://fastapi.tiangolo.com https://cdn.redoc.ly; "
+    "worker-src 'self' blob:; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+HSTS = "max-age=31536000; includeSubDomains"
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers to all responses.
+
+    Pure ASGI: the header pairs are encoded once at startup and appended to
+    ``http.response.start``. No extra task runs per request, and response
+    bodies, including streamed ones, pass through untouched.
+    ``path_csp`` maps exact paths to their own policy, for example the API
+    docs pages.
+    """
+
+    def __init__(self, app, csp: str = DEFAULT_CSP, path_csp: dict = None):
+        self.app = app
+        self.headers, self.https_headers = self._header_sets(csp)
+        self.path_headers = {path: self._header_sets(policy) for path, policy in (path_csp or {}).items()}
+
+    @staticmethod
+    def _header_sets(csp: str) -> tuple:
+        headers = [
+            (b"x-content-type-options", b"nosniff"),
+            (b"x-frame-options", b"DENY"),
+            (b"x-xss-protection", b"1; mode=block"),
+            (b"referrer-policy", b"strict-origin-when-cross-origin"),
+            (b"content-security-policy", csp.encode("latin-1")),
+        ]
         # HSTS header (only in production with HTTPS)
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        return response
+        return headers, headers + [(b"strict-transport-security", HSTS.encode("latin-1"))]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers, https_headers = self.path_headers.get(scope["path"], (self.headers, self.https_headers))
+        extra = https_headers if scope.get("scheme") == "https" else headers
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                # New list: the response object may reuse its own header list
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class PublicPathSessionMiddleware(SessionMiddleware):
+    """SessionMiddleware that leaves public API routes alone.
+
+    Requests whose path starts with one of ``public_prefixes`` get an empty,
+    throwaway session. Their cookie is never decoded or verified and no
+    Set-Cookie is sent. Paths under ``session_paths`` are exempt from the
+    bypass (for example admin-only endpoints that live under /api/).
+    """
+
+    def __init__(self, app, public_prefixes=("/api/",), session_paths=(), **kwargs):
+        super().__init__(app, **kwargs)
+        self.public_prefixes = tuple(public_prefixes)
+        self.session_paths = tuple(session_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path.startswith(self.public_prefixes) and not path.startswith(self.session_paths):
+                scope["session"] = {}
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
 
-def add_security_middleware(app: FastAPI):
+def add_security_middleware(app: FastAPI, csp: str = DEFAULT_CSP, docs_csp: str = DOCS_CSP):
     """Add security middleware to FastAPI app"""
-    app.add_middleware(SecurityHeadersMiddleware)
+    docs_paths = (app.docs_url, app.swagger_ui_oauth2_redirect_url, app.redoc_url)
+    app.add_middleware(
+        SecurityHeadersMiddleware,
+        csp=csp,
+        path_csp={path: docs_csp for path in docs_paths if path}
+    )
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Production launcher: one-time schema setup, then N uvicorn workers
+
+Environment:
+    WEB_CONCURRENCY   worker processes (default: CPUs available to the container)
+    PORT / API_PORT   listen port (default 8000)
+    API_HOST          listen address (default 0.0.0.0)
+"""
+import importlib.util
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
+
+# Read backend/.env before any setting below, not later in main's import
+load_dotenv()
+
+logger = logging.getLogger("server")
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, which respects container CPU sets"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    return max(1, int(os.getenv("WEB_CONCURRENCY", available_cpus())))
+
+
+def event_loop_impl() -> str:
+    """Use uvloop/httptools when installed, otherwise the stdlib implementations"""
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_impl() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def prepare(workers: int):
+    """Run everything that must happen exactly once, before workers start"""
+    os.environ["WAITLIST_LAUNCHED_AT"] = str(time.time())
+
+    # A per-process limiter would multiply every limit by the worker count
+    if workers > 1 and not os.getenv("RATE_LIMIT_STORAGE_URI"):
+        db_dir = os.path.dirname(os.path.abspath(os.getenv("DATABASE_PATH", "waitlist.db")))
+        os.environ["RATE_LIMIT_STORAGE_URI"] = f"sqlite:///{os.path.join(db_dir, 'ratelimits.db')}"
+
+    # Importing the app here surfaces import/config errors before any worker starts
+    started = time.perf_counter()
+    import main
+    main.init_db()
+    main.db_pool.close()
+    os.environ["WAITLIST_SCHEMA_READY"] = "1"
+    logger.info(f"Schema ready in {time.perf_counter() - started:.2f}s")
+    return main
+
+
+def run():
+    import uvicorn
+
+    host = os.getenv("API_HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", os.getenv("API_PORT", "8000")))
+    workers = worker_count()
+    loop = event_loop_impl()
+    http = http_impl()
+
+    main = prepare(workers)
+    logger.info(f"Starting {workers} worker(s) on {host}:{port} (loop={loop}, http={http})")
+    if workers == 1:
+        # Serve the already-imported app in this process
+        # workers=1 explicitly, or uvicorn falls back to WEB_CONCURRENCY from the environment
+        uvicorn.run(
+            main.app, host=host, port=port, workers=1,
+            loop=loop, http=http, log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "main:app", host=host, port=port, workers=workers,
+            loop=loop, http=http, log_level="info"
+        )
+
+
+if __name__ == "__main__":
+    run()
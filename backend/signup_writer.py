@@ -0,0 +1,182 @@
+"""
+Single-writer queue that group-commits waitlist signups
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from analytics import add_to_rollups, last_signup_id
+from database import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+_SIGNUP = "signup"
+_JOB = "job"
+
+
+class SignupWriter:
+    """Serializes every waitlist write through one task and one thread.
+
+    Signups queued while a batch is committing are picked up together and
+    inserted in a single transaction, so a burst of N signups costs roughly
+    one fsync instead of N. Each caller still gets its own result back.
+    Arbitrary write jobs can be queued with ``run`` so that they are ordered
+    with signups instead of competing for the SQLite write lock.
+    ``on_query`` works as for AsyncDatabase; batches are reported as
+    ``signup_batch``.
+
+    The writer holds its own dedicated connection (``pool.dedicated()``)
+    rather than checking one out per batch. Reads, exports and the writer
+    therefore never compete for the same pooled connections.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_batch: int = 256, on_query=None):
+        self.pool = pool
+        self.max_batch = max(1, max_batch)
+        self.on_query = on_query
+        self._queue = None
+        self._task = None
+        self._executor = None
+        self._conn = None
+
+        # Stats
+        self._batches = 0
+        self._rows = 0
+        self._inserted = 0
+        self._duplicates = 0
+        self._largest_batch = 0
+
+    async def start(self):
+        """Start the writer task on the running event loop"""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._conn = self.pool.dedicated()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="signup-writer")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush queued writes and stop the writer task"""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._executor.shutdown(wait=True)
+        self._task = None
+        self._conn.close()
+        self._conn = None
+        self._executor = None
+
+    async def submit(self, email: str, website: str, website_domain: str, email_canonical: str):
+        """Queue a signup; returns ``(inserted, total_signups)`` once committed"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((_SIGNUP, (email, website, website_domain, email_canonical), future))
+        return await future
+
+    async def run(self, fn, *args):
+        """Queue ``fn(conn, *args)`` to run on the writer and return its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((_JOB, (fn, args), future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        pending = None
+        while True:
+            item = pending if pending is not None else await self._queue.get()
+            pending = None
+            if item is None:
+                return
+
+            if item[0] == _JOB:
+                fn, args = item[1]
+                await self._dispatch(loop, [item], self._run_job, fn, args)
+                continue
+
+            batch = [item]
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if nxt is None or nxt[0] != _SIGNUP:
+                    # Finish this batch first so ordering is preserved
+                    pending = nxt
+                    break
+                batch.append(nxt)
+            await self._dispatch(loop, batch, self._commit_batch, [i[1] for i in batch])
+
+    async def _dispatch(self, loop, items, fn, *args):
+        """Run ``fn`` on the writer thread and resolve the callers' futures"""
+        try:
+            results = await loop.run_in_executor(self._executor, fn, *args)
+        except Exception as e:
+            logger.error(f"Signup writer failed: {str(e)}")
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _run_job(self, fn, args):
+        conn = self._conn
+        started = time.perf_counter()
+        try:
+            return [fn(conn, *args)]
+        finally:
+            # Never leave a job's dangling transaction open for the next batch
+            if conn.in_transaction:
+                conn.rollback()
+            if self.on_query is not None:
+                self.on_query(fn.__name__, time.perf_counter() - started)
+
+    def _commit_batch(self, signups):
+        conn = self._conn
+        started = time.perf_counter()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            inserted = []
+            after_id = last_signup_id(cursor)
+            for signup in signups:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO waitlist "
+                    "(email, website, website_domain, email_canonical) VALUES (?, ?, ?, ?)",
+                    signup
+                )
+                inserted.append(cursor.rowcount == 1)
+            if any(inserted):
+                add_to_rollups(cursor, after_id)
+            cursor.execute("SELECT total_signups FROM waitlist_stats WHERE id = 1")
+            row = cursor.fetchone()
+            total = row[0] if row else 0
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if self.on_query is not None:
+                self.on_query("signup_batch", time.perf_counter() - started)
+
+        added = sum(inserted)
+        self._batches += 1
+        self._rows += len(signups)
+        self._inserted += added
+        self._duplicates += len(signups) - added
+        self._largest_batch = max(self._largest_batch, len(signups))
+        return [(ok, total) for ok in inserted]
+
+    def stats(self) -> dict:
+        """Snapshot of writer counters"""
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batches": self._batches,
+            "rows": self._rows,
+            "inserted": self._inserted,
+            "duplicates": self._duplicates,
+            "largest_batch": self._largest_batch,
+            "avg_batch": round(self._rows / self._batches, 2) if self._batches else 0,
+        }
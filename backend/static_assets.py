@@ -0,0 +1,147 @@
+"""
+Static file serving for the frontend build with precompressed variants
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+
+from fastapi.responses import FileResponse, Response
+
+from cache import etag_matches
+
+# Vite puts content-hashed bundles here, so they can be cached forever
+IMMUTABLE_PREFIX = "assets/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+# index.html must be revalidated so new deploys are picked up immediately
+INDEX_CACHE_CONTROL = "no-cache"
+
+# Preferred order when the client accepts several encodings
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(accept_encoding: str) -> set:
+    """Content codings the client accepts (q > 0)"""
+    accepted = set()
+    for part in (accept_encoding or "").lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        q = 1.0
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding)
+    return accepted
+
+
+class StaticAssets:
+    """Index of the frontend build taken once at startup.
+
+    Lookups are a dict hit instead of filesystem calls per request.
+    Precompressed ``.br``/``.gz`` siblings written by compress_static.py are
+    served when the client accepts them. index.html is held in memory with
+    an ETag.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files = {}
+        self.index = None
+        if os.path.isdir(root):
+            self._scan()
+
+    def _scan(self):
+        for dirpath, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith((".gz", ".br")):
+                    continue
+                path = os.path.join(dirpath, name)
+                rel = os.path.relpath(path, self.root).replace(os.sep, "/")
+                variants = {
+                    coding: path + suffix
+                    for coding, suffix in ENCODINGS
+                    if os.path.isfile(path + suffix)
+                }
+                media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                stat = os.stat(path)
+                etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+                self.files[rel] = (path, media_type, variants, etag)
+
+        index = self.files.get("index.html")
+        if index is not None:
+            self.index = self._load_in_memory(index)
+
+    def _load_in_memory(self, entry):
+        path, media_type, variants, _ = entry
+        with open(path, "rb") as f:
+            body = f.read()
+        bodies = {"identity": body}
+        for coding, variant in variants.items():
+            with open(variant, "rb") as f:
+                bodies[coding] = f.read()
+        if "gzip" not in bodies:
+            bodies["gzip"] = gzip.compress(body, mtime=0)
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        return media_type, bodies, etag
+
+    @staticmethod
+    def _pick_encoding(accept_encoding: str, available) -> str:
+        if not available:
+            return "identity"
+        accepted = accepted_encodings(accept_encoding)
+        for coding, _ in ENCODINGS:
+            if coding in accepted and coding in available:
+                return coding
+        return "identity"
+
+    @staticmethod
+    def _variant_etag(etag: str, coding: str) -> str:
+        # Each encoding is a different representation, so it needs its own tag
+        return etag if coding == "identity" else f'{etag[:-1]}-{coding}"'
+
+    @staticmethod
+    def _cache_control(rel: str) -> str:
+        return IMMUTABLE_CACHE_CONTROL if rel.startswith(IMMUTABLE_PREFIX) else DEFAULT_CACHE_CONTROL
+
+    def file_response(self, rel: str, accept_encoding: str = "", if_none_match: str = None):
+        """Response for a file in the build, or None when it does not exist"""
+        if rel == "index.html":
+            return self.index_response(accept_encoding, if_none_match)
+        entry = self.files.get(rel)
+        if entry is None:
+            return None
+        path, media_type, variants, etag = entry
+        coding = self._pick_encoding(accept_encoding, variants)
+        headers = {
+            "Cache-Control": self._cache_control(rel),
+            "ETag": self._variant_etag(etag, coding),
+        }
+        if variants:
+            headers["Vary"] = "Accept-Encoding"
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        if coding == "identity":
+            return FileResponse(path, media_type=media_type, headers=headers)
+        headers["Content-Encoding"] = coding
+        return FileResponse(variants[coding], media_type=media_type, headers=headers)
+
+    def index_response(self, accept_encoding: str = "", if_none_match: str = None):
+        """In-memory index.html response, or None when the frontend is not built"""
+        if self.index is None:
+            return None
+        media_type, bodies, etag = self.index
+        coding = self._pick_encoding(accept_encoding, bodies)
+        headers = {
+            "Cache-Control": INDEX_CACHE_CONTROL,
+            "ETag": self._variant_etag(etag, coding),
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        if coding != "identity":
+            headers["Content-Encoding"] = coding
+        return Response(content=bodies[coding], media_type=media_type, headers=headers)
@@ -0,0 +1,108 @@
+"""
+Email and website validation/normalization shared by signup and bulk import
+"""
+import os
+import re
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlsplit
+
+EMAIL_MAX_LENGTH = 254
+LOCAL_PART_MAX_LENGTH = 64
+WEBSITE_MAX_LENGTH = 500
+
+DISPOSABLE_DOMAINS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "disposable_domains.txt")
+
+# Providers that ignore dots in the local part and share one mailbox namespace
+GMAIL_DOMAINS = frozenset({"gmail.com", "googlemail.com"})
+
+# local@domain with no whitespace or RFC 5322 specials, no empty domain labels
+# and at least one dot in the domain. Consecutive dots are rejected separately.
+_EMAIL_RE = re.compile(
+    r"[^\s@\"(),:;<>\[\]\\]+"
+    r"@"
+    r"[^\s@\"(),:;<>\[\]\\.]+(?:\.[^\s@\"(),:;<>\[\]\\.]+)+"
+)
+
+
+class InvalidEmail(ValueError):
+    """Raised with a user-facing message when an address is rejected"""
+
+
+@lru_cache(maxsize=1)
+def disposable_domains() -> frozenset:
+    """Blocked throwaway-mail domains, read once from disposable_domains.txt"""
+    try:
+        with open(DISPOSABLE_DOMAINS_PATH) as f:
+            return frozenset(
+                line.strip().lower() for line in f
+                if line.strip() and not line.startswith("#")
+            )
+    except FileNotFoundError:
+        return frozenset()
+
+
+@lru_cache(maxsize=8192)
+def is_disposable(domain: str) -> bool:
+    """True when the domain or any parent domain is a disposable provider"""
+    blocked = disposable_domains()
+    parts = domain.split(".")
+    return any(".".join(parts[i:]) in blocked for i in range(len(parts) - 1))
+
+
+def canonical_email(email: str) -> str:
+    """Mailbox identity used for duplicate detection.
+
+    Drops +tags from the local part and, for Gmail, dots as well, and maps
+    googlemail.com to gmail.com. Expects an already lowercased address.
+    """
+    local, sep, domain = email.rpartition("@")
+    if not sep:
+        return email
+    local = local.split("+", 1)[0] or local
+    if domain in GMAIL_DOMAINS:
+        local = local.replace(".", "")
+        domain = "gmail.com"
+    return f"{local}@{domain}"
+
+
+def validate_email(raw: str) -> tuple:
+    """Normalize and validate an address; returns ``(email, canonical)``.
+
+    Raises InvalidEmail on malformed or disposable addresses.
+    """
+    email = raw.strip().lower()
+    if (
+        len(email) > EMAIL_MAX_LENGTH
+        or ".." in email
+        or not _EMAIL_RE.fullmatch(email)
+    ):
+        raise InvalidEmail("Invalid email format")
+    local, _, domain = email.rpartition("@")
+    if len(local) > LOCAL_PART_MAX_LENGTH or local[0] == "." or local[-1] == ".":
+        raise InvalidEmail("Invalid email format")
+    if is_disposable(domain):
+        raise InvalidEmail("Disposable email addresses are not allowed")
+    return email, canonical_email(email)
+
+
+def website_domain(website: str) -> Optional[str]:
+    """Lowercased host of a website URL without a leading www., or None"""
+    website = (website or "").strip()
+    if not website:
+        return None
+    if "://" not in website:
+        website = "http://" + website
+    try:
+        host = urlsplit(website).hostname
+    except ValueError:
+        return None
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+def normalize_website(raw: str) -> tuple:
+    """Trimmed, length-limited website and its domain: ``(website, domain)``"""
+    website = (raw or "").strip()[:WEBSITE_MAX_LENGTH]
+    return website, website_domain(website)
@@ -10,6 +10,8 @@ cd ..
 echo "Installing backend dependencies..."
 cd backend
 pip install -r requirements.txt
+echo "Precompressing frontend assets..."
+python compress_static.py ../frontend/dist
 cd ..
 
-echo "Build complete! Run 'cd backend && python main.py' to start the combined app."
+echo "Build complete! Run 'cd backend && python server.py' to start the combined app."
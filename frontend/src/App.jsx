@@ -15,9 +15,22 @@ function App() {
     ? '' 
     : 'http://0.0.0.0:8000'
 
-  // Fetch current signup count on component mount
+  // Fetch current signup count on mount, then follow the live counter stream
   useEffect(() => {
     fetchStats()
+
+    if (typeof EventSource === 'undefined') return
+    const source = new EventSource(`${API_BASE}/api/stats/stream`)
+    source.onmessage = (event) => {
+      try {
+        const data = JSON.parse(event.data)
+        setTotalSignups(data.total_signups || 0)
+      } catch (error) {
+        console.error('Error parsing live stats:', error)
+      }
+    }
+    // EventSource reconnects on its own after errors
+    return () => source.close()
   }, [])
 
   const fetchStats = async () => {
@@ -11,4 +11,7 @@ echo "Installing backend dependencies..."
 cd backend
 pip install -r requirements.txt
 
+echo "Precompressing frontend assets..."
+python compress_static.py ../frontend/dist
+
 echo "Build complete!"